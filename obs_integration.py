@@ -3,12 +3,34 @@ OBS Studio integration for Silver Ronin livestream.
 Provides utilities for setting up and managing OBS scenes and sources.
 """
 import os
-import json
 import time
+import functools
+import hashlib
+from collections import deque
 from datetime import datetime
+from pathlib import Path
 from typing import Dict, List, Optional
 from loguru import logger
 
+from src.utils.jsonio import dumps
+
+# Asset directories, resolved once at import
+_ASSETS = Path("assets")
+_IMAGES = _ASSETS / "images"
+_AUDIO = _ASSETS / "audio"
+_MUSIC = _ASSETS / "music"
+
+
+@functools.lru_cache(maxsize=32)
+def _get_font(path: str, size: int):
+    """Load a TrueType font once per (path, size), falling back to the default font."""
+    from PIL import ImageFont
+    
+    try:
+        return ImageFont.truetype(path, size)
+    except OSError:
+        return ImageFont.load_default()
+
 class OBSIntegration:
     """OBS Studio integration helper for Silver Ronin."""
     
@@ -30,6 +52,14 @@ class OBSIntegration:
             "scenes": []
         }
         
+        # Current window of ticker headlines, newest first
+        self._ticker_titles = deque(maxlen=10)
+        self._ticker_hash = None
+        
+        # Create asset directories once
+        for directory in (_IMAGES, _AUDIO, _MUSIC):
+            directory.mkdir(parents=True, exist_ok=True)
+        
         # Define scene layout
         self.setup_scenes()
     
@@ -136,92 +166,111 @@ class OBSIntegration:
     
     def generate_scene_collection_file(self, filename: str = "silver_ronin_scene.json"):
         """Generate OBS scene collection file."""
-        output_file = os.path.join("assets", filename)
+        output_file = _ASSETS / filename
         
         try:
-            with open(output_file, 'w') as f:
-                json.dump(self.scene_collection, f, indent=2)
+            payload = dumps(self.scene_collection)
+            
+            # Skip the write when the file already has identical contents
+            if output_file.exists():
+                new_digest = hashlib.blake2b(payload, digest_size=16).digest()
+                if hashlib.blake2b(output_file.read_bytes(), digest_size=16).digest() == new_digest:
+                    logger.debug(f"OBS scene collection unchanged: {output_file}")
+                    return str(output_file)
+            
+            with open(output_file, 'wb') as f:
+                f.write(payload)
             
             logger.info(f"Generated OBS scene collection: {output_file}")
-            return output_file
+            return str(output_file)
         except Exception as e:
             logger.error(f"Error generating scene collection: {e}")
             return None
     
     def create_news_ticker_file(self, articles: List[Dict] = None):
         """Create news ticker text file for OBS."""
-        ticker_file = os.path.join("assets", "news_ticker.txt")
+        ticker_file = _ASSETS / "news_ticker.txt"
         
         try:
-            if articles:
-                # Create scrolling ticker text
-                ticker_text = "   ".join([f"• {article['title']}" for article in articles[:10]])
-            else:
-                ticker_text = "Welcome to Silver Ronin - 24/7 Precious Metals Market Coverage"
+            # Rebuild the window from the current top headlines so stale ones drop off
+            self._ticker_titles = deque((article['title'] for article in (articles or [])[:10]), maxlen=10)
             
-            with open(ticker_file, 'w', encoding='utf-8') as f:
-                f.write(ticker_text)
+            # Skip the write when the ticker hasn't changed
+            ticker_hash = hash(tuple(self._ticker_titles))
+            if ticker_hash == self._ticker_hash and ticker_file.exists():
+                logger.debug(f"News ticker unchanged: {ticker_file}")
+                return str(ticker_file)
+            
+            with open(ticker_file, 'w', encoding='utf-8', buffering=64 * 1024) as f:
+                if self._ticker_titles:
+                    # Stream the scrolling ticker text without building it in memory
+                    for i, title in enumerate(self._ticker_titles):
+                        if i:
+                            f.write("   ")
+                        f.write("• ")
+                        f.write(title)
+                else:
+                    f.write("Welcome to Silver Ronin - 24/7 Precious Metals Market Coverage")
+            
+            self._ticker_hash = ticker_hash
             
             logger.info(f"Updated news ticker: {ticker_file}")
-            return ticker_file
+            return str(ticker_file)
         except Exception as e:
             logger.error(f"Error creating news ticker: {e}")
             return None
     
+    def _is_prerendered(self, path: Path) -> bool:
+        """Check whether a static asset exists and is newer than this module."""
+        return path.exists() and path.stat().st_mtime > os.path.getmtime(__file__)
+    
     def create_background_image(self, filename: str = "background.png"):
         """Create a simple background image."""
+        output_path = _IMAGES / filename
+        if self._is_prerendered(output_path):
+            logger.info(f"Using pre-rendered background image: {output_path}")
+            return str(output_path)
+        
         try:
-            from PIL import Image, ImageDraw, ImageFont
+            from PIL import Image, ImageDraw
             
-            # Create 1920x1080 background
-            img = Image.new('RGB', (1920, 1080), color='#1a1a1a')
+            # Create 1920x1080 background with a dark vertical gradient
+            gradient = Image.linear_gradient('L').resize((1920, 1080), Image.BILINEAR)
+            gradient = gradient.point(lambda p: 26 + p * 20 // 255)
+            img = Image.merge('RGB', (gradient, gradient, gradient))
             draw = ImageDraw.Draw(img)
             
-            # Add gradient effect
-            for y in range(1080):
-                color_value = int(26 + (y / 1080) * 20)  # Dark gradient
-                draw.line([(0, y), (1920, y)], fill=(color_value, color_value, color_value))
-            
             # Add title
-            try:
-                font = ImageFont.truetype("arial.ttf", 60)
-            except:
-                font = ImageFont.load_default()
+            font = _get_font("arial.ttf", 60)
             
             text = "Silver Ronin"
-            bbox = draw.textbbox((0, 0), text, font=font)
-            text_width = bbox[2] - bbox[0]
-            text_height = bbox[3] - bbox[1]
+            left, _, right, _ = font.getbbox(text)
+            text_width = right - left
             
             x = (1920 - text_width) // 2
             y = 50
             
-            # Add text shadow
-            draw.text((x+2, y+2), text, fill=(0, 0, 0), font=font)
-            draw.text((x, y), text, fill=(255, 215, 0), font=font)  # Gold color
+            # Gold text with a dark outline in a single rasterization pass
+            draw.text((x, y), text, fill=(255, 215, 0), font=font,
+                      stroke_width=2, stroke_fill=(0, 0, 0))
             
             # Add subtitle
             subtitle = "24/7 Precious Metals Market Coverage"
-            try:
-                font_small = ImageFont.truetype("arial.ttf", 30)
-            except:
-                font_small = ImageFont.load_default()
+            font_small = _get_font("arial.ttf", 30)
             
-            bbox = draw.textbbox((0, 0), subtitle, font=font_small)
-            subtitle_width = bbox[2] - bbox[0]
+            left, _, right, _ = font_small.getbbox(subtitle)
+            subtitle_width = right - left
             x = (1920 - subtitle_width) // 2
             y = 120
             
-            draw.text((x+1, y+1), subtitle, fill=(0, 0, 0), font=font_small)
-            draw.text((x, y), subtitle, fill=(192, 192, 192), font=font_small)
+            draw.text((x, y), subtitle, fill=(192, 192, 192), font=font_small,
+                      stroke_width=1, stroke_fill=(0, 0, 0))
             
             # Save image
-            output_path = os.path.join("assets", "images", filename)
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
             img.save(output_path)
             
             logger.info(f"Created background image: {output_path}")
-            return output_path
+            return str(output_path)
             
         except ImportError:
             logger.warning("PIL not installed. Cannot create background image.")
@@ -232,9 +281,23 @@ class OBSIntegration:
     
     def create_avatar_placeholder(self, filename: str = "avatar.png"):
         """Create a simple avatar placeholder."""
+        output_path = _IMAGES / filename
+        if self._is_prerendered(output_path):
+            logger.info(f"Using pre-rendered avatar placeholder: {output_path}")
+            return str(output_path)
+        
+        pixels_path = _ASSETS / f".{Path(filename).stem}.npy"
+        
         try:
+            import numpy as np
             from PIL import Image, ImageDraw
             
+            # Rebuild from the cached pixel buffer unless the drawing code has changed since
+            if self._is_prerendered(pixels_path):
+                Image.fromarray(np.load(pixels_path), 'RGBA').save(output_path)
+                logger.info(f"Restored avatar placeholder from {pixels_path}: {output_path}")
+                return str(output_path)
+            
             # Create 400x400 avatar
             img = Image.new('RGBA', (400, 400), color=(0, 0, 0, 0))
             draw = ImageDraw.Draw(img)
@@ -254,12 +317,12 @@ class OBSIntegration:
             draw.line([200, 50, 200, 20], fill=(192, 192, 192, 255), width=5)
             draw.ellipse([190, 10, 210, 30], fill=(255, 0, 0, 255))
             
-            # Save image
-            output_path = os.path.join("assets", "images", filename)
+            # Save image and its pixel buffer for future regenerations
             img.save(output_path)
+            np.save(pixels_path, np.asarray(img))
             
             logger.info(f"Created avatar placeholder: {output_path}")
-            return output_path
+            return str(output_path)
             
         except ImportError:
             logger.warning("PIL not installed. Cannot create avatar placeholder.")
@@ -281,14 +344,14 @@ class OBSIntegration:
             }
         }
         
-        settings_file = os.path.join("assets", "stream_settings.json")
+        settings_file = _ASSETS / "stream_settings.json"
         
         try:
-            with open(settings_file, 'w') as f:
-                json.dump(settings, f, indent=2)
+            with open(settings_file, 'wb') as f:
+                f.write(dumps(settings))
             
             logger.info(f"Generated stream settings: {settings_file}")
-            return settings_file
+            return str(settings_file)
         except Exception as e:
             logger.error(f"Error generating stream settings: {e}")
             return None
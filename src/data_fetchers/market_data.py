@@ -1,21 +1,85 @@
-""
+"""
 Market data fetcher for precious metals prices.
 Supports multiple data sources with fallback mechanisms.
 """
 import os
 import time
 import logging
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, Optional, List, Tuple
+import numpy as np
 import requests
-from datetime import datetime, timezone
-from dataclasses import dataclass
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from datetime import date, datetime, timedelta, timezone
+from dataclasses import dataclass, field
 from loguru import logger
 
+from ..utils.jsonio import dumps, loads
+
+try:
+    import httpx
+    import h2  # noqa: F401  (httpx needs it for http2=True)
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+    logger.warning("httpx with HTTP/2 not available. Install with: pip install 'httpx[http2]'")
+
+# Ordinal of the Unix epoch, for converting ISO dates to timestamps
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+# Network errors that should trigger the per-metal fallback
+_HTTP_ERRORS = (requests.exceptions.RequestException,) + ((httpx.HTTPError,) if HTTPX_AVAILABLE else ())
+
+
+def _create_session() -> requests.Session:
+    """Create an HTTP session with keep-alive pooling and retries on transient errors."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=['GET']
+        )
+    )
+    session.mount('https://', adapter)
+    session.headers.update({
+        'Content-Type': 'application/json',
+        'Accept-Encoding': 'gzip'
+    })
+    return session
+
 
-@dataclass
+# Shared session so every fetcher reuses the same pooled connections
+_session = _create_session()
+
+
+def _create_http2_client() -> 'httpx.Client':
+    """Create a long-lived HTTP/2 client that retries failed connection attempts."""
+    return httpx.Client(
+        http2=True,
+        transport=httpx.HTTPTransport(http2=True, retries=3),
+        timeout=10,
+        headers={'Accept-Encoding': 'gzip'}
+    )
+
+
+# Shared HTTP/2 client; its single connection multiplexes concurrent requests
+_http2_client = _create_http2_client() if HTTPX_AVAILABLE else None
+
+
+@dataclass(slots=True)
 class MetalPrice:
-    """Data class for storing metal price information."""
+    """Data class for storing metal price information.
+    
+    Formatted strings are computed on first access and cached, so price
+    fields should be final by the time they are read.
+    """
     symbol: str
     name: str
     price: float
@@ -24,6 +88,8 @@ class MetalPrice:
     timestamp: float
     change_24h: Optional[float] = None
     change_pct_24h: Optional[float] = None
+    _formatted_price: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _formatted_change: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
@@ -40,21 +106,44 @@ class MetalPrice:
             'formatted_change': self.formatted_change
         }
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize the raw price fields to JSON without building an intermediate dict."""
+        return dumps(self, indent=False)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'MetalPrice':
+        """Create a MetalPrice from a dictionary produced by to_dict or to_json_bytes."""
+        return cls(
+            symbol=data['symbol'],
+            name=data['name'],
+            price=data['price'],
+            currency=data['currency'],
+            unit=data['unit'],
+            timestamp=data['timestamp'],
+            change_24h=data.get('change_24h'),
+            change_pct_24h=data.get('change_pct_24h')
+        )
+
     @property
     def formatted_price(self) -> str:
         """Format price with currency symbol and proper decimal places."""
-        if self.currency == 'USD':
-            return f"${self.price:,.2f}"
-        return f"{self.price:,.2f} {self.currency}"
+        if self._formatted_price is None:
+            if self.currency == 'USD':
+                self._formatted_price = f"${self.price:,.2f}"
+            else:
+                self._formatted_price = f"{self.price:,.2f} {self.currency}"
+        return self._formatted_price
 
     @property
     def formatted_change(self) -> str:
         """Format 24h change with sign and percentage."""
-        if self.change_24h is None or self.change_pct_24h is None:
-            return "N/A"
-        
-        sign = '+' if self.change_24h >= 0 else ''
-        return f"{sign}{self.change_24h:.2f} ({sign}{self.change_pct_24h:.2f}%)"
+        if self._formatted_change is None:
+            if self.change_24h is None or self.change_pct_24h is None:
+                self._formatted_change = "N/A"
+            else:
+                sign = '+' if self.change_24h >= 0 else ''
+                self._formatted_change = f"{sign}{self.change_24h:.2f} ({sign}{self.change_pct_24h:.2f}%)"
+        return self._formatted_change
 
 
 class MarketDataFetcher(ABC):
@@ -68,122 +157,233 @@ class MarketDataFetcher(ABC):
     
     @abstractmethod
     def fetch_prices(self, metals: List[str] = None) -> Dict[str, MetalPrice]:
-        ""Fetch current prices for the specified metals.""
+        """Fetch current prices for the specified metals."""
         pass
     
     @abstractmethod
     def get_historical_data(self, metal: str, days: int = 30) -> List[Tuple[float, float]]:
-        ""Fetch historical price data for a metal.""
+        """Fetch historical price data for a metal."""
         pass
 
 
 class MetalPriceAPIFetcher(MarketDataFetcher):
-    ""Fetches metal prices from MetalPriceAPI (https://metalpriceapi.com/)."""
+    """Fetches metal prices from MetalPriceAPI (https://metalpriceapi.com/)."""
     
     BASE_URL = "https://api.metalpriceapi.com/v1"
     
     # Map of metal symbols to their API codes and display names
     METAL_MAP = {
-        'XAU': {'code': 'XAU', 'name': 'Gold', 'unit': 'oz'},
-        'XAG': {'code': 'XAG', 'name': 'Silver', 'unit': 'oz'},
-        'XPT': {'code': 'XPT', 'name': 'Platinum', 'unit': 'oz'},
-        'XPD': {'code': 'XPD', 'name': 'Palladium', 'unit': 'oz'}
+        'XAU': {'code': 'XAU', 'api_code': 'XXAU', 'name': 'Gold', 'unit': 'oz'},
+        'XAG': {'code': 'XAG', 'api_code': 'XXAG', 'name': 'Silver', 'unit': 'oz'},
+        'XPT': {'code': 'XPT', 'api_code': 'XXPT', 'name': 'Platinum', 'unit': 'oz'},
+        'XPD': {'code': 'XPD', 'api_code': 'XXPD', 'name': 'Palladium', 'unit': 'oz'}
     }
     
-    def __init__(self, api_key: str = None):
-        """Initialize with API key."""
+    def __init__(self, api_key: str = None, cache_ttl: int = 60, history_cache_ttl: int = 3600,
+                 cache_file: str = os.path.join("assets", ".market_cache.json")):
+        """Initialize with API key.
+        
+        Args:
+            api_key: MetalPriceAPI key (defaults to METALPRICE_API_KEY)
+            cache_ttl: Time in seconds to cache latest prices
+            history_cache_ttl: Time in seconds to cache historical data
+            cache_file: JSON file mirroring the cache across restarts
+        """
         super().__init__(api_key)
-        self.session = requests.Session()
-        self.session.headers.update({'Content-Type': 'application/json'})
+        self.session = _session
+        
+        # Response cache: key -> (fetch time, value)
+        self.cache_ttl = cache_ttl
+        self.history_cache_ttl = history_cache_ttl
+        self.cache_file = cache_file
+        self._cache: Dict[str, Tuple[float, object]] = {}
+        self._cache_lock = threading.RLock()
+        self._load_cache()
+    
+    def _load_cache(self):
+        """Load cached responses from disk so restarts don't cold-start."""
+        try:
+            with open(self.cache_file, 'rb') as f:
+                data = loads(f.read())
+        except (OSError, ValueError):
+            return
+        
+        for key, (fetched_at, value) in data.items():
+            if key.startswith('latest:'):
+                value = {symbol: MetalPrice.from_dict(price) for symbol, price in value.items()}
+            else:
+                value = [tuple(point) for point in value]
+            self._cache[key] = (fetched_at, value)
+    
+    def _save_cache(self):
+        """Mirror the in-memory cache to disk."""
+        # MetalPrice dataclasses are serialized natively, skipping to_dict
+        data = {key: [fetched_at, value] for key, (fetched_at, value) in self._cache.items()}
+        
+        try:
+            os.makedirs(os.path.dirname(self.cache_file) or '.', exist_ok=True)
+            with open(self.cache_file, 'wb') as f:
+                f.write(dumps(data, indent=False))
+        except OSError as e:
+            logger.warning(f"Could not save market data cache: {e}")
+    
+    def _get_cached(self, key: str, ttl: int):
+        """Return a cached value if it is younger than ttl seconds."""
+        entry = self._cache.get(key)
+        if entry and (time.time() - entry[0]) < ttl:
+            return entry[1]
+        return None
+    
+    def _set_cached(self, key: str, value):
+        """Store a value in the cache and persist it."""
+        with self._cache_lock:
+            self._cache[key] = (time.time(), value)
+            self._save_cache()
     
     def fetch_prices(self, metals: List[str] = None) -> Dict[str, MetalPrice]:
-        ""Fetch current prices for the specified metals.""
+        """Fetch current prices for the specified metals."""
         if not metals:
             metals = list(self.METAL_MAP.keys())
         
+        # Check cache first
+        cache_key = f"latest:{','.join(sorted(metals))}"
+        cached = self._get_cached(cache_key, self.cache_ttl)
+        if cached is not None:
+            logger.debug("Returning cached metal prices")
+            return cached
+        
+        # Concurrent callers on a miss wait for one fetch instead of each hitting the API
+        with self._cache_lock:
+            cached = self._get_cached(cache_key, self.cache_ttl)
+            if cached is not None:
+                return cached
+            
+            prices = self._fetch_latest(metals)
+            if prices:
+                self._set_cached(cache_key, prices)
+        
+        return prices
+    
+    def _fetch_latest(self, metals: List[str]) -> Dict[str, MetalPrice]:
+        """Fetch current prices from the API, falling back to per-metal requests."""
         prices = {}
         
         try:
-            # Fetch all metals at once if possible
-            response = self.session.get(
-                f"{self.BASE_URL}/latest",
-                params={
-                    'api_key': self.api_key,
-                    'base': 'USD',
-                    'currencies': ','.join([f"X{metal}" for metal in metals if metal in self.METAL_MAP])
-                },
-                timeout=10
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            # Process the response
-            timestamp = data.get('timestamp', time.time())
-            
-            for metal_code, price in data.get('rates', {}).items():
-                # Skip base currency
-                if metal_code == 'USD':
-                    continue
-                    
-                # Extract the metal symbol (remove the 'X' prefix)
-                symbol = metal_code[1:] if metal_code.startswith('X') else metal_code
+            if HTTPX_AVAILABLE:
+                # Fetch latest prices and yesterday's rates concurrently
+                prices = self.fetch_all(metals)
+            else:
+                # Fetch all metals at once if possible
+                response = self.session.get(
+                    f"{self.BASE_URL}/latest",
+                    params=self._latest_params(metals),
+                    timeout=10
+                )
+                response.raise_for_status()
+                prices = self._parse_latest(response.json())
                 
-                if symbol in self.METAL_MAP:
-                    metal_info = self.METAL_MAP[symbol]
-                    prices[symbol] = MetalPrice(
-                        symbol=symbol,
-                        name=metal_info['name'],
-                        price=1.0 / price,  # Convert from USD per XAU to XAU per USD
-                        currency='USD',
-                        unit=metal_info['unit'],
-                        timestamp=timestamp
-                    )
+                # Try to get 24h change if available
+                self._update_24h_changes(prices)
             
-            # Try to get 24h change if available
-            self._update_24h_changes(prices)
-            
-        except requests.exceptions.RequestException as e:
+        except _HTTP_ERRORS as e:
             logger.error(f"Error fetching metal prices: {e}")
             # Fallback to individual requests if batch fails
-            return self._fetch_prices_individually(metals)
+            prices = self._fetch_prices_individually(metals)
         
         return prices
     
-    def _fetch_prices_individually(self, metals: List[str]) -> Dict[str, MetalPrice]:
-        ""Fallback method to fetch prices one by one.""
+    def fetch_all(self, metals: List[str] = None) -> Dict[str, MetalPrice]:
+        """Fetch latest prices and 24h changes with concurrent requests.
+        
+        The /latest and /timeframe requests are issued together and share
+        the pooled HTTP/2 connection.
+        """
+        if not metals:
+            metals = list(self.METAL_MAP.keys())
+        
+        symbols = [metal for metal in metals if metal in self.METAL_MAP]
+        yesterday_str, timeframe_params = self._yesterday_params(symbols)
+        
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            history_future = executor.submit(
+                _http2_client.get, f"{self.BASE_URL}/timeframe", params=timeframe_params
+            )
+            latest = _http2_client.get(f"{self.BASE_URL}/latest", params=self._latest_params(metals))
+            
+            latest.raise_for_status()
+            prices = self._parse_latest(latest.json())
+            
+            try:
+                history = history_future.result()
+                history.raise_for_status()
+                self._apply_24h_changes(prices, history.json().get('rates', {}).get(yesterday_str, {}))
+            except httpx.HTTPError as e:
+                logger.warning(f"Could not get 24h changes: {e}")
+        
+        return prices
+    
+    def _latest_params(self, metals: List[str]) -> dict:
+        """Build query parameters for the /latest endpoint."""
+        return {
+            'api_key': self.api_key,
+            'base': 'USD',
+            'currencies': ','.join(self.METAL_MAP[metal]['api_code'] for metal in metals if metal in self.METAL_MAP)
+        }
+    
+    def _yesterday_params(self, symbols: List[str]) -> Tuple[str, dict]:
+        """Build query parameters for a /timeframe request covering yesterday and today."""
+        end_date = datetime.now(timezone.utc)
+        yesterday_str = (end_date - timedelta(days=1)).strftime('%Y-%m-%d')
+        return yesterday_str, {
+            'api_key': self.api_key,
+            'start_date': yesterday_str,
+            'end_date': end_date.strftime('%Y-%m-%d'),
+            'base': 'USD',
+            'currencies': ','.join(self.METAL_MAP[symbol]['api_code'] for symbol in symbols)
+        }
+    
+    def _parse_latest(self, data: dict) -> Dict[str, MetalPrice]:
+        """Convert a /latest response into MetalPrice objects."""
         prices = {}
+        timestamp = data.get('timestamp', time.time())
         
-        for metal in metals:
-            if metal not in self.METAL_MAP:
+        for metal_code, price in data.get('rates', {}).items():
+            # Skip base currency
+            if metal_code == 'USD':
                 continue
                 
-            try:
-                response = self.session.get(
-                    f"{self.BASE_URL}/latest",
-                    params={
-                        'api_key': self.api_key,
-                        'base': 'USD',
-                        'currencies': f"X{metal}"
-                    },
-                    timeout=5
-                )
-                response.raise_for_status()
-                data = response.json()
-                
-                price = list(data.get('rates', {}).values())[0]
-                metal_info = self.METAL_MAP[metal]
-                
-                prices[metal] = MetalPrice(
-                    symbol=metal,
+            # Extract the metal symbol (remove the 'X' prefix)
+            symbol = metal_code[1:] if metal_code.startswith('X') else metal_code
+            
+            if symbol in self.METAL_MAP:
+                metal_info = self.METAL_MAP[symbol]
+                prices[symbol] = MetalPrice(
+                    symbol=symbol,
                     name=metal_info['name'],
                     price=1.0 / price,  # Convert from USD per XAU to XAU per USD
                     currency='USD',
                     unit=metal_info['unit'],
-                    timestamp=data.get('timestamp', time.time())
+                    timestamp=timestamp
                 )
-                
-            except (requests.exceptions.RequestException, (KeyError, IndexError)) as e:
-                logger.error(f"Error fetching {metal} price: {e}")
+        
+        return prices
+    
+    def _fetch_prices_individually(self, metals: List[str]) -> Dict[str, MetalPrice]:
+        """Fallback method to fetch prices one by one, concurrently."""
+        prices = {}
+        metals = [metal for metal in metals if metal in self.METAL_MAP]
+        if not metals:
+            return prices
+        
+        with ThreadPoolExecutor(max_workers=min(8, len(metals))) as executor:
+            futures = {executor.submit(self._fetch_one, metal): metal for metal in metals}
+            
+            for future in as_completed(futures):
+                metal = futures[future]
+                try:
+                    prices[metal] = future.result()
+                except (requests.exceptions.RequestException, KeyError, IndexError) as e:
+                    logger.error(f"Error fetching {metal} price: {e}")
         
         # Update 24h changes if we got any prices
         if prices:
@@ -191,45 +391,80 @@ class MetalPriceAPIFetcher(MarketDataFetcher):
             
         return prices
     
+    def _fetch_one(self, metal: str) -> MetalPrice:
+        """Fetch the latest price for a single metal."""
+        response = self.session.get(
+            f"{self.BASE_URL}/latest",
+            params={
+                'api_key': self.api_key,
+                'base': 'USD',
+                'currencies': self.METAL_MAP[metal]['api_code']
+            },
+            timeout=5
+        )
+        response.raise_for_status()
+        data = response.json()
+        
+        price = list(data.get('rates', {}).values())[0]
+        metal_info = self.METAL_MAP[metal]
+        
+        return MetalPrice(
+            symbol=metal,
+            name=metal_info['name'],
+            price=1.0 / price,  # Convert from USD per XAU to XAU per USD
+            currency='USD',
+            unit=metal_info['unit'],
+            timestamp=data.get('timestamp', time.time())
+        )
+    
     def _update_24h_changes(self, prices: Dict[str, MetalPrice]):
-        ""Update 24h price changes for the given prices."""
+        """Update 24h price changes for the given prices with a single timeframe request."""
+        symbols = [symbol for symbol in prices if symbol in self.METAL_MAP]
+        if not symbols:
+            return
+        
+        # Get yesterday's rates for all metals in one request
+        yesterday_str, params = self._yesterday_params(symbols)
+        
         try:
-            # Get historical data for 24 hours ago
-            yesterday = int(time.time()) - 86400  # 24 hours in seconds
-            
-            for symbol, price in prices.items():
-                if symbol not in self.METAL_MAP:
-                    continue
-                    
-                try:
-                    response = self.session.get(
-                        f"{self.BASE_URL}/{yesterday}",
-                        params={
-                            'api_key': self.api_key,
-                            'base': 'USD',
-                            'currencies': f"X{symbol}"
-                        },
-                        timeout=5
-                    )
-                    response.raise_for_status()
-                    data = response.json()
-                    
-                    if 'rates' in data and f"X{symbol}" in data['rates']:
-                        old_price = 1.0 / data['rates'][f"X{symbol}"]
-                        price.change_24h = price.price - old_price
-                        price.change_pct_24h = (price.change_24h / old_price) * 100
-                        
-                except (requests.exceptions.RequestException, (KeyError, ZeroDivisionError)) as e:
-                    logger.warning(f"Could not get 24h change for {symbol}: {e}")
-                    
-        except Exception as e:
-            logger.error(f"Error updating 24h changes: {e}")
+            response = self.session.get(
+                f"{self.BASE_URL}/timeframe",
+                params=params,
+                timeout=5
+            )
+            response.raise_for_status()
+            old_rates = response.json().get('rates', {}).get(yesterday_str, {})
+        except (requests.exceptions.RequestException, ValueError, AttributeError) as e:
+            logger.warning(f"Could not get 24h changes: {e}")
+            return
+        
+        self._apply_24h_changes(prices, old_rates)
+    
+    def _apply_24h_changes(self, prices: Dict[str, MetalPrice], old_rates: Dict[str, float]):
+        """Set 24h changes on prices from yesterday's rates."""
+        for symbol, price in prices.items():
+            if symbol not in self.METAL_MAP:
+                continue
+                
+            try:
+                old_price = 1.0 / old_rates[self.METAL_MAP[symbol]['api_code']]
+                price.change_24h = price.price - old_price
+                price.change_pct_24h = (price.change_24h / old_price) * 100
+            except (KeyError, ZeroDivisionError) as e:
+                logger.warning(f"Could not get 24h change for {symbol}: {e}")
     
     def get_historical_data(self, metal: str, days: int = 30) -> List[Tuple[float, float]]:
-        ""Fetch historical price data for a metal.""
+        """Fetch historical price data for a metal."""
         if metal not in self.METAL_MAP:
             raise ValueError(f"Unsupported metal: {metal}")
         
+        # Check cache first
+        cache_key = f"timeframe:{metal}:{days}"
+        cached = self._get_cached(cache_key, self.history_cache_ttl)
+        if cached is not None:
+            logger.debug(f"Returning cached historical data for {metal}")
+            return cached
+        
         end_date = datetime.now(timezone.utc)
         start_date = end_date - timedelta(days=days)
         
@@ -241,23 +476,30 @@ class MetalPriceAPIFetcher(MarketDataFetcher):
                     'start_date': start_date.strftime('%Y-%m-%d'),
                     'end_date': end_date.strftime('%Y-%m-%d'),
                     'base': 'USD',
-                    'currencies': f"X{metal}"
+                    'currencies': self.METAL_MAP[metal]['api_code']
                 },
                 timeout=10
             )
             response.raise_for_status()
             data = response.json()
             
-            # Process the response into (timestamp, price) pairs
-            historical_data = []
-            for date_str, rates in data.get('rates', {}).items():
-                if f"X{metal}" in rates:
-                    timestamp = datetime.strptime(date_str, '%Y-%m-%d').timestamp()
-                    price = 1.0 / rates[f"X{metal}"]  # Convert from USD per XAU to XAU per USD
-                    historical_data.append((timestamp, price))
+            # Collect the metal's rates sorted by date (ISO dates sort chronologically)
+            code = self.METAL_MAP[metal]['api_code']
+            items = sorted(
+                (date_str, rates[code])
+                for date_str, rates in data.get('rates', {}).items()
+                if code in rates
+            )
+            
+            # Process the response into (timestamp, price) pairs at UTC midnight
+            ordinals = np.array([date.fromisoformat(date_str).toordinal() for date_str, _ in items], dtype=np.float64)
+            timestamps = (ordinals - _EPOCH_ORDINAL) * 86400.0
+            prices = 1.0 / np.array([rate for _, rate in items], dtype=np.float64)  # Convert from USD per XAU to XAU per USD
+            historical_data = list(zip(timestamps.tolist(), prices.tolist()))
+            
+            if historical_data:
+                self._set_cached(cache_key, historical_data)
             
-            # Sort by timestamp
-            historical_data.sort()
             return historical_data
             
         except requests.exceptions.RequestException as e:
@@ -270,5 +512,5 @@ market_data_fetcher = MetalPriceAPIFetcher()
 
 
 def get_market_data_fetcher() -> MarketDataFetcher:
-    ""Get the default market data fetcher instance."""
+    """Get the default market data fetcher instance."""
     return market_data_fetcher
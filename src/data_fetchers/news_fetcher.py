@@ -3,19 +3,62 @@ News fetcher for precious metals related news.
 Supports multiple RSS feeds and news sources with filtering and caching.
 """
 import os
+import asyncio
+import calendar
 import feedparser
 import requests
+from cachetools import LFUCache
 import logging
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict, Optional
-from dataclasses import dataclass
-from datetime import datetime, timedelta
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timezone
 from urllib.parse import urlparse
 from loguru import logger
 import time
 import random
-import json
+import pickle
+import re
+import email.utils
+import xml.etree.ElementTree as ET
 
-@dataclass
+from ..utils.jsonio import dumps
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+    logger.warning("aiohttp not available. Install with: pip install aiohttp")
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+    logger.warning("pyahocorasick not available. Install with: pip install pyahocorasick")
+
+# Namespaced RSS elements read by the streaming parser
+_MEDIA_CONTENT = '{http://search.yahoo.com/mrss/}content'
+_ISO_DATE_TAGS = ('{http://purl.org/dc/elements/1.1/}date', '{http://www.w3.org/2005/Atom}updated', 'updated')
+
+def _parse_iso_date(value: str) -> Optional[float]:
+    """Parse a W3C/ISO 8601 date (dc:date, atom:updated) to a timestamp; naive dates are UTC."""
+    try:
+        parsed = datetime.fromisoformat(value.strip().replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+def _canonical_url(url: str) -> str:
+    """Normalize a URL by lowercasing and removing query parameters and trailing slashes."""
+    return url.lower().split('?', 1)[0].rstrip('/')
+
+@dataclass(slots=True)
 class NewsArticle:
     """Data class for storing news article information."""
     title: str
@@ -25,6 +68,15 @@ class NewsArticle:
     summary: str = ""
     image_url: Optional[str] = None
     category: str = "general"
+    published_ts: float = field(init=False, repr=False, compare=False)
+    published_iso: str = field(init=False, repr=False, compare=False)
+    canonical_url: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Precompute derived fields used for deduplication and serialization."""
+        self.published_ts = self.published.timestamp()
+        self.published_iso = self.published.isoformat()
+        self.canonical_url = _canonical_url(self.url)
     
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
@@ -32,7 +84,7 @@ class NewsArticle:
             'title': self.title,
             'url': self.url,
             'source': self.source,
-            'published': self.published.isoformat(),
+            'published': self.published_iso,
             'summary': self.summary,
             'image_url': self.image_url,
             'category': self.category
@@ -41,35 +93,66 @@ class NewsArticle:
     @property
     def formatted_date(self) -> str:
         """Format the published date in a human-readable format."""
-        now = datetime.now(self.published.tzinfo) if self.published.tzinfo else datetime.now()
-        delta = now - self.published
+        return self.format_date(time.time())
+    
+    def format_date(self, now: float) -> str:
+        """Format the published date relative to the epoch timestamp now."""
+        delta = now - self.published_ts
         
-        if delta < timedelta(minutes=1):
+        if delta < 60:
             return "Just now"
-        elif delta < timedelta(hours=1):
-            minutes = int(delta.seconds / 60)
+        elif delta < 3600:
+            minutes = int(delta // 60)
             return f"{minutes} minute{'s' if minutes > 1 else ''} ago"
-        elif delta < timedelta(days=1):
-            hours = int(delta.seconds / 3600)
+        elif delta < 86400:
+            hours = int(delta // 3600)
             return f"{hours} hour{'s' if hours > 1 else ''} ago"
-        elif delta < timedelta(days=30):
-            days = delta.days
+        elif delta < 30 * 86400:
+            days = int(delta // 86400)
             return f"{days} day{'s' if days > 1 else ''} ago"
         else:
             return self.published.strftime("%b %d, %Y")
 
+
+def format_dates(articles: List[NewsArticle]) -> List[str]:
+    """Format the published dates of many articles against a single clock read."""
+    now = time.time()
+    return [article.format_date(now) for article in articles]
+
 class NewsFetcher:
     """Fetches news articles related to precious metals from various sources."""
     
-    def __init__(self, cache_ttl: int = 300):
+    def __init__(self, cache_ttl: int = 300,
+                 cache_file: str = os.path.join(os.path.expanduser("~"), ".cache", "silveronin", "news.pkl")):
         """Initialize the news fetcher.
         
         Args:
             cache_ttl: Time in seconds to cache news articles
+            cache_file: Pickle file persisting the cache across restarts
         """
         self.cache_ttl = cache_ttl
+        self.cache_file = cache_file
         self.last_fetch_time = 0
         self.cached_articles = []
+        self._load_cache()
+        
+        # Per-request results keyed by (cache_ttl time bucket, max_articles)
+        self._results = LFUCache(maxsize=32)
+        
+        # Pooled session reused across feed fetches
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=8,
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        )
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        
+        # HTTP validators and last parsed articles per feed, for conditional requests
+        self._etags: Dict[str, str] = {}
+        self._modified: Dict[str, str] = {}
+        self._feed_articles: Dict[str, List[NewsArticle]] = {}
         self.user_agents = [
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/92.0.4515.107 Safari/537.36',
@@ -78,6 +161,17 @@ class NewsFetcher:
             'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.1 Safari/605.1.15'
         ]
         
+        # Pick one user agent per session so connection pools stay warm
+        self._headers = {
+            'User-Agent': random.choice(self.user_agents),
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.5',
+            'Connection': 'keep-alive',
+            'Upgrade-Insecure-Requests': '1',
+            'Cache-Control': 'max-age=0'
+        }
+        self._session.headers.update(self._headers)
+        
         # Define news sources with their RSS feeds
         self.sources = {
             'kitco': {
@@ -103,122 +197,359 @@ class NewsFetcher:
             'bullion', 'mining', 'commodities', 'inflation', 'fed', 'interest rates',
             'central bank', 'xau', 'xag', 'xpt', 'xpd', 'kitco', 'comex', 'lbma'
         ]
+        
+        self._keywords_lower = tuple(keyword.lower() for keyword in self.keywords)
+        
+        # Single-pass keyword matcher, with a compiled bytes regex alternation as fallback
+        self._keyword_automaton = None
+        if AHOCORASICK_AVAILABLE:
+            self._keyword_automaton = ahocorasick.Automaton()
+            for keyword in self._keywords_lower:
+                self._keyword_automaton.add_word(keyword, keyword)
+            self._keyword_automaton.make_automaton()
+        self._keyword_pattern = re.compile(
+            b'|'.join(re.escape(keyword.encode('ascii')) for keyword in self._keywords_lower)
+        )
     
-    def _get_random_headers(self) -> dict:
-        """Get random headers to avoid being blocked."""
-        return {
-            'User-Agent': random.choice(self.user_agents),
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Cache-Control': 'max-age=0'
-        }
+    def _load_cache(self):
+        """Load cached articles from disk if they are still fresh."""
+        try:
+            with open(self.cache_file, 'rb') as f:
+                data = pickle.load(f)
+            ts, articles = data['ts'], list(data['articles'])
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            # A corrupt or outdated cache must never stop the fetcher from being built
+            logger.warning(f"Could not load news cache from {self.cache_file}: {e}")
+            return
+        
+        if (time.time() - ts) < self.cache_ttl:
+            self.cached_articles = articles
+            self.last_fetch_time = ts
+            logger.debug(f"Loaded {len(self.cached_articles)} cached news articles")
+    
+    def _save_cache(self):
+        """Atomically persist the cached articles to disk."""
+        tmp_file = f"{self.cache_file}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            with open(tmp_file, 'wb') as f:
+                pickle.dump({'ts': self.last_fetch_time, 'articles': self.cached_articles}, f, protocol=5)
+            os.replace(tmp_file, self.cache_file)
+        except OSError as e:
+            logger.warning(f"Could not save news cache to {self.cache_file}: {e}")
+    
+    def _conditional_headers(self, url: str) -> dict:
+        """Get the validator headers from the last fetch of url.
+        
+        The session-wide headers are set on the HTTP sessions themselves.
+        """
+        headers = {}
+        if url in self._etags:
+            headers['If-None-Match'] = self._etags[url]
+        if url in self._modified:
+            headers['If-Modified-Since'] = self._modified[url]
+        return headers
+    
+    def _remember_validators(self, url: str, headers) -> None:
+        """Store the ETag and Last-Modified headers of a feed response."""
+        if headers.get('ETag'):
+            self._etags[url] = headers['ETag']
+        if headers.get('Last-Modified'):
+            self._modified[url] = headers['Last-Modified']
     
     def _parse_rss_feed(self, url: str, source: str, category: str) -> List[NewsArticle]:
-        """Parse an RSS feed and return a list of NewsArticle objects."""
+        """Fetch and parse an RSS feed and return a list of NewsArticle objects."""
+        try:
+            # Stream the (gzip/br decoded) body straight into the parser
+            with self._session.get(url, headers=self._conditional_headers(url), stream=True, timeout=10) as response:
+                if response.status_code == 304:
+                    logger.debug(f"Feed not modified: {url}")
+                    return self._feed_articles.get(url, [])
+                
+                response.raise_for_status()
+                self._remember_validators(url, response.headers)
+                articles = self._parse_feed_stream(response.iter_content(chunk_size=16384), source, category)
+            self._feed_articles[url] = articles
+            return articles
+        except Exception as e:
+            logger.error(f"Error fetching RSS feed {url}: {e}")
+            return []
+    
+    def _parse_feed_stream(self, chunks, source: str, category: str) -> List[NewsArticle]:
+        """Incrementally parse a plain RSS 2.0 feed from an iterable of byte chunks.
+        
+        Only the item fields we use are read, and each item is cleared once
+        converted. Anything that is not RSS 2.0 (Atom, RDF) or fails to parse
+        is handed to feedparser instead.
+        """
+        chunks = iter(chunks)
+        received = []
         articles = []
+        parser = ET.XMLPullParser(events=('start', 'end'))
+        root = None
+        now = time.time()
+        cutoff = now - 7 * 86400
+        
         try:
-            # Add cache-busting parameter to avoid cached responses
-            cache_buster = int(time.time())
-            feed_url = f"{url}?{cache_buster}" if "?" not in url else f"{url}&{cache_buster}"
-            
-            # Parse the feed with a timeout
-            feed = feedparser.parse(feed_url, request_headers=self._get_random_headers(), 
-                                  timeout=10)
+            for chunk in chunks:
+                received.append(chunk)
+                parser.feed(chunk)
+                for event, elem in parser.read_events():
+                    if root is None:
+                        root = elem.tag
+                        if root != 'rss':
+                            break
+                    elif event == 'end' and elem.tag == 'item':
+                        article = self._parse_rss_item(elem, source, category, now)
+                        if article is not None and article.published_ts >= cutoff:
+                            articles.append(article)
+                        elem.clear()
+                if root is not None and root != 'rss':
+                    break
+            parser.close()
+        except ET.ParseError as e:
+            logger.debug(f"Streaming parse failed for {source}, falling back to feedparser: {e}")
+            root = None
+        
+        if root == 'rss':
+            return articles
+        
+        feed = feedparser.parse(b''.join(received) + b''.join(chunks))
+        return self._parse_feed_entries(feed, source, category)
+    
+    def _parse_rss_item(self, item: ET.Element, source: str, category: str,
+                        now: float) -> Optional[NewsArticle]:
+        """Convert an RSS <item> element into a NewsArticle."""
+        title = (item.findtext('title') or '').strip()
+        url = (item.findtext('link') or '').strip()
+        if not title or not url:
+            return None
+        
+        published_ts = None
+        pub_date = item.findtext('pubDate')
+        if pub_date:
+            parsed = email.utils.parsedate_tz(pub_date)
+            if parsed:
+                published_ts = email.utils.mktime_tz(parsed)
+        
+        # Some feeds only carry dc:date or atom:updated
+        if published_ts is None:
+            for tag in _ISO_DATE_TAGS:
+                value = item.findtext(tag)
+                if value:
+                    published_ts = _parse_iso_date(value)
+                    if published_ts is not None:
+                        break
+        
+        if published_ts is None:
+            published_ts = now
+        
+        article = NewsArticle(
+            title=title,
+            url=url,
+            source=source.capitalize(),
+            published=datetime.fromtimestamp(published_ts, timezone.utc),
+            summary=item.findtext('description') or '',
+            category=category
+        )
+        
+        # Try to get an image URL if available
+        media = item.find(_MEDIA_CONTENT)
+        if media is not None and media.get('url'):
+            article.image_url = media.get('url')
+        else:
+            for enclosure in item.iter('enclosure'):
+                if enclosure.get('type', '').startswith('image/'):
+                    article.image_url = enclosure.get('url')
+                    break
+        
+        return article
+    
+    def _parse_feed_entries(self, feed, source: str, category: str) -> List[NewsArticle]:
+        """Convert parsed feed entries into NewsArticle objects."""
+        articles = []
+        now = time.time()
+        cutoff = now - 7 * 86400
+        
+        for entry in feed.entries:
+            try:
+                # Skip entries without a title or URL
+                if not getattr(entry, 'title', None) or not getattr(entry, 'link', None):
+                    continue
+                
+                # Parse the published date (feedparser's struct_time is UTC)
+                published_parsed = entry.get('published_parsed') or entry.get('updated_parsed')
+                published_ts = calendar.timegm(published_parsed) if published_parsed else now
+                
+                # Skip articles older than 7 days
+                if published_ts < cutoff:
+                    continue
+                
+                # Create the article
+                article = NewsArticle(
+                    title=entry.title,
+                    url=entry.link,
+                    source=source.capitalize(),
+                    published=datetime.fromtimestamp(published_ts, timezone.utc),
+                    summary=getattr(entry, 'summary', ''),
+                    category=category
+                )
+                
+                # Try to get an image URL if available
+                if hasattr(entry, 'media_content') and entry.media_content:
+                    article.image_url = entry.media_content[0]['url']
+                elif hasattr(entry, 'links') and entry.links:
+                    for link in entry.links:
+                        if link.get('type', '').startswith('image/'):
+                            article.image_url = link.href
+                            break
+                
+                articles.append(article)
+                
+            except Exception as e:
+                logger.warning(f"Error parsing article from {source}: {e}")
+                continue
+        
+        return articles
+    
+    def _fetch_all_threaded(self, sources: Dict[str, dict]) -> List[NewsArticle]:
+        """Fetch and parse feeds concurrently on a thread pool."""
+        all_articles = []
+        
+        with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+            futures = {
+                executor.submit(
+                    self._parse_rss_feed,
+                    source_info['url'],
+                    source_name,
+                    source_info.get('category', 'general')
+                ): source_name
+                for source_name, source_info in sources.items()
+            }
             
-            for entry in feed.entries:
+            for future in as_completed(futures):
+                source_name = futures[future]
                 try:
-                    # Skip entries without a title or URL
-                    if not getattr(entry, 'title', None) or not getattr(entry, 'link', None):
-                        continue
-                    
-                    # Parse the published date
-                    published = datetime.now()
-                    if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                        published = datetime(*entry.published_parsed[:6])
-                    elif hasattr(entry, 'updated_parsed') and entry.updated_parsed:
-                        published = datetime(*entry.updated_parsed[:6])
-                    
-                    # Skip articles older than 7 days
-                    if (datetime.now() - published) > timedelta(days=7):
-                        continue
-                    
-                    # Create the article
-                    article = NewsArticle(
-                        title=entry.title,
-                        url=entry.link,
-                        source=source.capitalize(),
-                        published=published,
-                        summary=getattr(entry, 'summary', '')[:200] + '...',
-                        category=category
-                    )
-                    
-                    # Try to get an image URL if available
-                    if hasattr(entry, 'media_content') and entry.media_content:
-                        article.image_url = entry.media_content[0]['url']
-                    elif hasattr(entry, 'links') and entry.links:
-                        for link in entry.links:
-                            if link.get('type', '').startswith('image/'):
-                                article.image_url = link.href
-                                break
-                    
-                    articles.append(article)
-                    
+                    articles = future.result()
+                    all_articles.extend(articles)
+                    logger.debug(f"Found {len(articles)} articles from {source_name}")
                 except Exception as e:
-                    logger.warning(f"Error parsing article from {source}: {e}")
-                    continue
-                    
-        except Exception as e:
+                    logger.error(f"Error fetching from {source_name}: {e}")
+        
+        return all_articles
+    
+    async def _fetch_bytes(self, session: 'aiohttp.ClientSession', url: str) -> Optional[bytes]:
+        """Fetch the raw body of a URL, or None if it is unchanged since the last fetch."""
+        async with session.get(url, headers=self._conditional_headers(url)) as response:
+            if response.status == 304:
+                return None
+            response.raise_for_status()
+            self._remember_validators(url, response.headers)
+            return await response.read()
+    
+    async def _fetch_source_async(self, session: 'aiohttp.ClientSession', source_name: str,
+                                  source_info: dict) -> List[NewsArticle]:
+        """Fetch one feed over the shared session and parse it off the event loop."""
+        url = source_info['url']
+        try:
+            data = await self._fetch_bytes(session, url)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             logger.error(f"Error fetching RSS feed {url}: {e}")
+            return []
+        
+        if data is None:
+            logger.debug(f"Feed not modified: {url}")
+            return self._feed_articles.get(url, [])
         
+        # Parsing is CPU-bound, so keep it off the event loop
+        loop = asyncio.get_running_loop()
+        articles = await loop.run_in_executor(
+            None, self._parse_feed_stream, (data,), source_name, source_info.get('category', 'general')
+        )
+        self._feed_articles[url] = articles
+        logger.debug(f"Found {len(articles)} articles from {source_name}")
         return articles
     
-    def _filter_relevant_articles(self, articles: List[NewsArticle]) -> List[NewsArticle]:
-        """Filter articles based on relevance to precious metals."""
-        relevant_articles = []
+    async def _fetch_all_async(self, sources: Dict[str, dict]) -> List[NewsArticle]:
+        """Fetch all feeds concurrently over one pooled aiohttp session."""
+        connector = aiohttp.TCPConnector(limit=10, ttl_dns_cache=300)
+        timeout = aiohttp.ClientTimeout(total=10)
         
-        for article in articles:
-            # Check if any keyword is in the title or summary (case-insensitive)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout, headers=self._headers) as session:
+            results = await asyncio.gather(*(
+                self._fetch_source_async(session, source_name, source_info)
+                for source_name, source_info in sources.items()
+            ))
+        
+        return [article for articles in results for article in articles]
+    
+    def _matches_keywords(self, article: NewsArticle) -> bool:
+        """Check if any keyword is in the title or summary (case-insensitive)."""
+        if self._keyword_automaton is not None:
+            # Stop at the first match found by the automaton
             content = f"{article.title} {article.summary}".lower()
-            if any(keyword.lower() in content for keyword in self.keywords):
-                relevant_articles.append(article)
+            return next(self._keyword_automaton.iter(content), None) is not None
         
-        return relevant_articles
+        # Keywords are ASCII, so match against lowercased ASCII bytes
+        return bool(
+            self._keyword_pattern.search(article.title.encode('ascii', 'ignore').lower())
+            or self._keyword_pattern.search(article.summary.encode('ascii', 'ignore').lower())
+        )
     
-    def _remove_duplicates(self, articles: List[NewsArticle]) -> List[NewsArticle]:
-        """Remove duplicate articles based on URL and title similarity."""
+    def _select_articles(self, articles: List[NewsArticle]) -> List[NewsArticle]:
+        """Keep relevant, non-duplicate articles in a single newest-first pass.
+        
+        Walking newest first means the newest copy of a duplicate is kept and
+        the result is already sorted by date.
+        """
         seen_urls = set()
-        unique_articles = []
+        kept_shingles = []
+        selected = []
         
-        for article in sorted(articles, key=lambda x: x.published, reverse=True):
-            # Normalize URL
-            url = article.url.lower().split('?')[0]  # Remove query parameters
-            url = url.rstrip('/')  # Remove trailing slashes
+        for article in sorted(articles, key=lambda x: x.published_ts, reverse=True):
+            # Skip articles not about precious metals
+            if not self._matches_keywords(article):
+                continue
             
             # Check if we've seen this URL before
+            url = article.canonical_url
             if url in seen_urls:
                 continue
-                
+            
             # Check for similar titles (prevent different URLs with same content)
-            title = article.title.lower()
-            is_duplicate = False
-            for seen_title in [a.title.lower() for a in unique_articles]:
-                # If titles are very similar, consider them duplicates
-                if self._similar(title, seen_title) > 0.8:
-                    is_duplicate = True
-                    break
+            shingles = self._shingles(article.title.lower())
+            if any(self._similar(shingles, seen) > 0.8 for seen in kept_shingles):
+                continue
             
-            if not is_duplicate:
-                seen_urls.add(url)
-                unique_articles.append(article)
+            seen_urls.add(url)
+            kept_shingles.append(shingles)
+            selected.append(article)
         
-        return unique_articles
+        return selected
     
-    def _similar(self, a: str, b: str) -> float:
-        """Calculate similarity ratio between two strings."""
-        from difflib import SequenceMatcher
-        return SequenceMatcher(None, a, b).ratio()
+    def _trim_summaries(self, articles: List[NewsArticle], length: int = 200) -> List[NewsArticle]:
+        """Return articles with long summaries trimmed, only for articles that survived filtering.
+        
+        Trimmed articles are copies, so the per-feed articles reused on a 304 keep their full text.
+        """
+        return [
+            replace(article, summary=article.summary[:length] + '...') if len(article.summary) > length else article
+            for article in articles
+        ]
+    
+    def _shingles(self, text: str, size: int = 4) -> frozenset:
+        """Split text into the set of its overlapping character n-grams."""
+        if len(text) <= size:
+            return frozenset((text,))
+        return frozenset(text[i:i + size] for i in range(len(text) - size + 1))
+    
+    def _similar(self, a: frozenset, b: frozenset) -> float:
+        """Calculate the Jaccard similarity between two shingle sets."""
+        if not a and not b:
+            return 1.0
+        return len(a & b) / len(a | b)
     
     def fetch_news(self, max_articles: int = 20) -> List[NewsArticle]:
         """Fetch news articles from all sources.
@@ -233,46 +564,34 @@ class NewsFetcher:
         current_time = time.time()
         if (current_time - self.last_fetch_time) < self.cache_ttl and self.cached_articles:
             logger.debug("Returning cached news articles")
-            return self.cached_articles[:max_articles]
+            key = (int(current_time // self.cache_ttl), max_articles)
+            result = self._results.get(key)
+            if result is None:
+                result = self._results[key] = tuple(self.cached_articles[:max_articles])
+            # Hand out a fresh list so callers can never mutate the cached entry
+            return list(result)
         
         all_articles = []
         
-        # Fetch from each source
-        for source_name, source_info in self.sources.items():
-            try:
-                logger.debug(f"Fetching news from {source_name}...")
-                
-                if source_info['type'] == 'rss':
-                    articles = self._parse_rss_feed(
-                        source_info['url'], 
-                        source_name,
-                        source_info.get('category', 'general')
-                    )
-                else:
-                    continue
-                
-                all_articles.extend(articles)
-                logger.debug(f"Found {len(articles)} articles from {source_name}")
-                
-                # Be nice to the servers
-                time.sleep(1)
-                
-            except Exception as e:
-                logger.error(f"Error fetching from {source_name}: {e}")
-                continue
-        
-        # Process the articles
-        relevant_articles = self._filter_relevant_articles(all_articles)
-        unique_articles = self._remove_duplicates(relevant_articles)
+        # Fetch from all sources concurrently (each host is hit once per cycle)
+        rss_sources = {name: info for name, info in self.sources.items() if info['type'] == 'rss'}
+        if rss_sources:
+            if AIOHTTP_AVAILABLE:
+                all_articles = asyncio.run(self._fetch_all_async(rss_sources))
+            else:
+                all_articles = self._fetch_all_threaded(rss_sources)
         
-        # Sort by date (newest first)
-        unique_articles.sort(key=lambda x: x.published, reverse=True)
+        # Filter and deduplicate, newest first
+        unique_articles = self._trim_summaries(self._select_articles(all_articles))
         
         # Update cache
         self.cached_articles = unique_articles
         self.last_fetch_time = current_time
+        self._save_cache()
         
-        return unique_articles[:max_articles]
+        self._results.clear()
+        result = self._results[(int(current_time // self.cache_ttl), max_articles)] = tuple(unique_articles[:max_articles])
+        return list(result)
     
     def save_to_json(self, articles: List[NewsArticle], filename: str) -> None:
         """Save articles to a JSON file.
@@ -282,8 +601,8 @@ class NewsFetcher:
             filename: Output JSON filename
         """
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump([article.to_dict() for article in articles], f, indent=2, ensure_ascii=False)
+            with open(filename, 'wb') as f:
+                f.write(dumps([article.to_dict() for article in articles]))
             logger.info(f"Saved {len(articles)} articles to {filename}")
         except Exception as e:
             logger.error(f"Error saving articles to {filename}: {e}")
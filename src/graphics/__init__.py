@@ -1,4 +1,4 @@
 """Graphics and visualization modules for Silver Ronin."""
-from .graph_generator import GraphGenerator, get_graph_generator
+from .graph_generator import GraphGenerator, RenderState, get_graph_generator
 
-__all__ = ['GraphGenerator', 'get_graph_generator']
+__all__ = ['GraphGenerator', 'RenderState', 'get_graph_generator']
@@ -3,19 +3,118 @@ Graph generator for real-time precious metals price visualization.
 Creates dynamic charts with market hours highlighting and live updates.
 """
 import os
+import math
 import time
 import logging
 from typing import Dict, List, Optional, Tuple
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
+import matplotlib.image as mpimg
+from matplotlib import font_manager
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 import numpy as np
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timedelta, timezone, tzinfo
 import pytz
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from loguru import logger
-import json
 
 from ..data_fetchers.market_data import MetalPrice, get_market_data_fetcher
+from ..utils.jsonio import dumps
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logger.warning("numba not available. Install with: pip install numba")
+    
+    def njit(*args, **kwargs):
+        """Fall back to running the decorated function as plain Python."""
+        return lambda func: func
+
+
+# Matplotlib date number of the Unix epoch, for converting epoch seconds
+_EPOCH_DATENUM = mdates.date2num(datetime(1970, 1, 1, tzinfo=timezone.utc))
+
+# Metals shown on every graph
+SYMBOLS = ('XAU', 'XAG', 'XPT', 'XPD')
+SYMBOL_COLORS = {
+    'XAU': '#FFD700',
+    'XAG': '#C0C0C0',
+    'XPT': '#E5E4E2',
+    'XPD': '#B59410'
+}
+SYMBOL_NAMES = {
+    'XAU': 'Gold',
+    'XAG': 'Silver',
+    'XPT': 'Platinum',
+    'XPD': 'Palladium'
+}
+
+@njit(cache=True)
+def _downsample_lttb(times: np.ndarray, prices: np.ndarray, target: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Downsample a series to target points with Largest-Triangle-Three-Buckets.
+    
+    The first and last points are always kept.
+    """
+    n = times.shape[0]
+    if target >= n or target < 3:
+        return times, prices
+    
+    out_times = np.empty(target)
+    out_prices = np.empty(target)
+    out_times[0] = times[0]
+    out_prices[0] = prices[0]
+    
+    bucket_size = (n - 2) / (target - 2)
+    selected = 0
+    for i in range(target - 2):
+        # Average point of the next bucket
+        next_start = int((i + 1) * bucket_size) + 1
+        next_end = min(int((i + 2) * bucket_size) + 1, n)
+        avg_time = times[next_start:next_end].mean()
+        avg_price = prices[next_start:next_end].mean()
+        
+        # Keep the point of this bucket forming the largest triangle with
+        # the previously kept point and the next bucket's average
+        best = int(i * bucket_size) + 1
+        best_area = -1.0
+        for j in range(best, int((i + 1) * bucket_size) + 1):
+            area = abs((times[selected] - avg_time) * (prices[j] - prices[selected])
+                       - (times[selected] - times[j]) * (avg_price - prices[selected]))
+            if area > best_area:
+                best_area = area
+                best = j
+        
+        out_times[i + 1] = times[best]
+        out_prices[i + 1] = prices[best]
+        selected = best
+    
+    out_times[target - 1] = times[n - 1]
+    out_prices[target - 1] = prices[n - 1]
+    return out_times, out_prices
+
+# Placeholder headlines for the overview's news panel
+PLACEHOLDER_HEADLINES = [
+    "Gold prices steady amid Fed uncertainty",
+    "Silver demand rises in solar sector",
+    "Platinum supply concerns persist",
+    "Central banks continue gold purchases"
+]
+
+def _nice_ceiling(value: float) -> float:
+    """Round a positive value up to two significant digits."""
+    if not value > 0:
+        return 1.0
+    step = 10 ** (math.floor(math.log10(value)) - 1)
+    return math.ceil(value / step) * step
+
+def _nice_bounds(low: float, high: float) -> Tuple[float, float]:
+    """Widen a data range outwards to multiples of its order of magnitude."""
+    span = (high - low) or abs(high) or 1.0
+    step = 10 ** math.floor(math.log10(span))
+    return math.floor(low / step) * step, math.ceil(high / step) * step
 
 @dataclass
 class MarketHours:
@@ -26,6 +125,23 @@ class MarketHours:
     close_hour: int  # UTC hour
     color: str
     alpha: float = 0.2
+    tz: tzinfo = field(init=False, repr=False)
+    open_mask: int = field(init=False, repr=False)  # Bit h set iff open_hour <= h < close_hour
+    
+    def __post_init__(self):
+        """Resolve the timezone and the open hours bitmap once instead of on every render."""
+        self.tz = pytz.timezone(self.timezone)
+        self.open_mask = sum(1 << hour for hour in range(self.open_hour, self.close_hour))
+
+@dataclass(frozen=True)
+class RenderState:
+    """Data shared by every graph in one update, ordered like SYMBOLS and the market hours."""
+    now: datetime
+    prices: np.ndarray
+    changes: np.ndarray
+    present: np.ndarray  # False for metals missing from the update
+    price_labels: Tuple[str, ...]
+    market_open: Tuple[bool, ...]
 
 class GraphGenerator:
     """Generates real-time graphs for precious metals prices."""
@@ -53,14 +169,28 @@ class GraphGenerator:
         # Graph styling
         self.setup_matplotlib_style()
         
-        # Cache for historical data
-        self.price_history = {}
+        # Price history ring buffers (epoch seconds and one price array per metal).
+        # Every point is written twice, N apart, so the last N points are always
+        # one contiguous, time-ordered slice.
         self.max_history_points = 100  # Keep last 100 data points
+        self._times = np.empty(2 * self.max_history_points)
+        self._prices = {symbol: np.empty(2 * self.max_history_points) for symbol in SYMBOLS}
+        self._head = 0
+        self._filled = 0
         
         # Output files
         self.current_prices_file = os.path.join(output_dir, "current_prices.png")
         self.price_history_file = os.path.join(output_dir, "price_history.png")
         self.market_overview_file = os.path.join(output_dir, "market_overview.png")
+        self._last_metadata_key = None
+        
+        # Data each graph was last rendered from, to skip re-rendering unchanged inputs
+        self._render_keys = {}
+        
+        # Build each figure once; updates only mutate the cached artists
+        self._init_current_prices_figure()
+        self._init_price_history_figure()
+        self._init_market_overview_figure()
     
     def setup_matplotlib_style(self):
         """Set up matplotlib styling for professional appearance."""
@@ -79,6 +209,14 @@ class GraphGenerator:
             'negative': '#FF0000'
         }
         
+        # Resolve the font once; a missing family would otherwise warn on every text artist
+        try:
+            font_manager.findfont(font_manager.FontProperties(family='Arial'), fallback_to_default=False)
+            font_family = 'Arial'
+        except ValueError:
+            font_family = 'DejaVu Sans'
+        self.font = font_manager.FontProperties(family=font_family)
+        
         # Set default parameters
         plt.rcParams.update({
             'figure.facecolor': self.colors['background'],
@@ -90,391 +228,533 @@ class GraphGenerator:
             'ytick.color': self.colors['text'],
             'grid.color': self.colors['grid'],
             'grid.alpha': 0.3,
-            'font.family': 'Arial',
+            'font.family': font_family,
             'font.size': 10,
             'axes.titlesize': 14,
             'axes.labelsize': 12,
             'figure.titlesize': 16,
+            # Rendering speed: simplify dense paths and skip glyph hinting
+            'path.simplify': True,
+            'path.simplify_threshold': 1.0,
+            'agg.path.chunksize': 10000,
+            'text.hinting': 'no_hinting',
         })
     
     def get_current_utc_time(self) -> datetime:
         """Get current UTC time."""
         return datetime.now(timezone.utc)
     
-    def is_market_open(self, market: MarketHours) -> bool:
-        """Check if a market is currently open."""
-        now = self.get_current_utc_time()
-        return market.open_hour <= now.hour < market.close_hour
+    def is_market_open(self, market: MarketHours, now: Optional[datetime] = None) -> bool:
+        """Check if a market is currently open.
+        
+        Args:
+            market: Market to check
+            now: Current UTC time, to share one snapshot across a render
+        """
+        now = now or self.get_current_utc_time()
+        return bool((market.open_mask >> now.hour) & 1)
     
-    def add_market_hours_background(self, ax, start_time: datetime, end_time: datetime):
-        """Add colored backgrounds for market hours."""
+    def add_market_hours_background(self, ax, start_time: datetime, end_time: datetime) -> list:
+        """Add colored backgrounds for market hours and return the added spans.
+        
+        Each contiguous run of open hours becomes a single span.
+        """
+        # Hourly steps across the graph, in epoch seconds
+        hours = np.arange(int(start_time.timestamp()), int(end_time.timestamp()) + 1, 3600)
+        hour_nums = hours / 86400.0 + _EPOCH_DATENUM
+        
+        spans = []
         for market in self.market_hours:
-            # Convert market hours to UTC
-            market_tz = pytz.timezone(market.timezone)
-            
-            # Create time range for the graph
-            time_range = []
-            current = start_time
-            while current <= end_time:
-                time_range.append(current)
-                current += timedelta(hours=1)
+            # One timezone conversion per market, then local hours for every step
+            offset = end_time.astimezone(market.tz).utcoffset().total_seconds()
+            local_hours = ((hours + int(offset)) // 3600) % 24
+            is_open = ((market.open_mask >> local_hours) & 1).astype(bool)
             
-            # Find market hours within the time range
-            for dt in time_range:
-                dt_local = dt.astimezone(market_tz)
-                if market.open_hour <= dt_local.hour < market.close_hour:
-                    ax.axvspan(dt, dt + timedelta(hours=1), 
-                             alpha=market.alpha, color=market.color, zorder=0)
-    
-    def update_price_history(self, prices: Dict[str, MetalPrice]):
+            # Start and end indices of each run of open hours
+            edges = np.flatnonzero(np.diff(np.r_[0, is_open.view(np.int8), 0]))
+            for start, end in zip(edges[::2], edges[1::2]):
+                spans.append(ax.axvspan(hour_nums[start], hour_nums[end - 1] + 1 / 24,
+                                        alpha=market.alpha, color=market.color, zorder=0))
+        return spans
+    
+    def update_price_history(self, prices: Dict[str, MetalPrice], now: Optional[datetime] = None):
         """Update the price history cache."""
-        current_time = self.get_current_utc_time()
-        
-        for symbol, price in prices.items():
-            if symbol not in self.price_history:
-                self.price_history[symbol] = []
-            
-            # Add new data point
-            self.price_history[symbol].append((current_time, price.price))
-            
-            # Keep only the last N points
-            if len(self.price_history[symbol]) > self.max_history_points:
-                self.price_history[symbol] = self.price_history[symbol][-self.max_history_points:]
+        n = self.max_history_points
+        head = self._head
+        now = now or self.get_current_utc_time()
+        
+        # Add new data point (metals missing from this update are recorded as gaps)
+        self._times[head] = self._times[head + n] = now.timestamp()
+        for symbol, series in self._prices.items():
+            price = prices.get(symbol)
+            series[head] = series[head + n] = price.price if price else np.nan
+        
+        # Advance the ring, overwriting the oldest point once full
+        self._head = (head + 1) % n
+        self._filled = min(self._filled + 1, n)
     
-    def generate_current_prices_graph(self, prices: Dict[str, MetalPrice]) -> str:
-        """Generate a graph showing current prices with 24h changes."""
-        if not prices:
-            logger.warning("No price data available for current prices graph")
-            return self.current_prices_file
+    def _history_slice(self, series: np.ndarray) -> np.ndarray:
+        """Get the filled part of a history ring buffer, oldest point first."""
+        end = self._head + self.max_history_points
+        return series[end - self._filled:end]
+    
+    def _save_figure(self, fig, path: str):
+        """Render a cached figure straight to PNG with its fixed layout."""
+        fig.canvas.print_png(path)
+    
+    def _init_value_bars(self, ax, names, colors, label_kwargs: dict, **bar_kwargs):
+        """Create one bar per metal with an empty value label above each."""
+        bars = ax.bar(names, np.zeros(len(names)), color=colors, **bar_kwargs)
+        labels = [ax.text(bar.get_x() + bar.get_width()/2., 0, '', ha='center', va='bottom', **label_kwargs)
+                  for bar in bars]
+        return bars, labels
+    
+    def _extract_render_state(self, prices: Dict[str, MetalPrice], now: datetime) -> RenderState:
+        """Pack the prices and market status shared by all graphs into one RenderState.
         
-        # Create figure
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8), 
-                                        gridspec_kw={'height_ratios': [3, 1]})
-        fig.suptitle('Precious Metals - Current Prices', fontsize=16, fontweight='bold')
+        Metals missing from prices are 0 and False in the present mask.
+        """
+        n = len(SYMBOLS)
+        present = np.fromiter((sym in prices for sym in SYMBOLS), bool, n)
+        prices_arr = np.fromiter((prices[sym].price if sym in prices else 0.0 
+                                  for sym in SYMBOLS), float, n)
+        changes_arr = np.fromiter(((prices[sym].change_24h or 0.0) if sym in prices else 0.0 
+                                   for sym in SYMBOLS), float, n)
+        price_labels = tuple(f'${price:,.2f}' if shown else '' 
+                             for price, shown in zip(prices_arr.tolist(), present.tolist()))
+        
+        return RenderState(
+            now=now,
+            prices=prices_arr,
+            changes=changes_arr,
+            present=present,
+            price_labels=price_labels,
+            market_open=tuple(self.is_market_open(m, now) for m in self.market_hours)
+        )
+    
+    def _update_price_bars(self, ax, bars, labels, values: np.ndarray, texts: List[str]):
+        """Set bar heights to the current prices and move their labels on top."""
+        label_y = values * 1.01
+        for bar, label, price, y, text in zip(bars, labels, values.tolist(), label_y.tolist(), texts):
+            bar.set_height(price)
+            label.set_y(y)
+            label.set_text(text)
+        
+        # Rounded limits only move when prices cross a step
+        ax.set_ylim(0, _nice_ceiling(values.max() * 1.1))
+    
+    def _update_change_bars(self, ax, bars, labels, changes: np.ndarray, texts: List[str]):
+        """Set bar heights and colors to the 24h changes and update their labels."""
+        rising = (changes >= 0).tolist()
+        label_y = (changes + np.where(changes >= 0, 0.01, -0.01)).tolist()
+        for bar, label, change, up, y, text in zip(bars, labels, changes.tolist(), rising, label_y, texts):
+            bar.set_height(change)
+            bar.set_facecolor(self.colors['positive'] if up else self.colors['negative'])
+            label.set_y(y)
+            label.set_verticalalignment('bottom' if up else 'top')
+            label.set_text(text)
+        
+        limit = _nice_ceiling(np.abs(changes).max() * 1.3)
+        ax.set_ylim(-limit, limit)
+    
+    def _history_window(self, symbol: str, start_ts: float, 
+                        width_px: int) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Get the (date numbers, prices) of a symbol's history since start_ts.
         
-        # Extract data
-        symbols = list(prices.keys())
-        current_prices = [prices[sym].price for sym in symbols]
-        changes_24h = [prices[sym].change_24h or 0 for sym in symbols]
-        
-        # Color mapping
-        symbol_colors = {
-            'XAU': self.colors['gold'],
-            'XAG': self.colors['silver'],
-            'XPT': self.colors['platinum'],
-            'XPD': self.colors['palladium']
-        }
+        Args:
+            symbol: Metal symbol
+            start_ts: Start of the time window, in epoch seconds
+            width_px: Width of the plot in pixels; longer series are downsampled to it
+        """
+        times = self._history_slice(self._times)
+        start = np.searchsorted(times, start_ts)
+        times = times[start:]
+        prices = self._history_slice(self._prices[symbol])[start:]
+        if np.isnan(prices).all():
+            return None
+        
+        # More than two points per pixel cannot be seen, only drawn
+        if len(times) > 2 * width_px:
+            times, prices = _downsample_lttb(times, prices, width_px)
+        return times / 86400.0 + _EPOCH_DATENUM, prices
+    
+    def _new_figure(self, figsize: Tuple[float, float]) -> Figure:
+        """Create a figure for the lifetime of the generator.
         
-        colors = [symbol_colors.get(sym, '#FFFFFF') for sym in symbols]
+        Figures are built outside pyplot on their own Agg canvas, so they are
+        never registered with (or torn down by) a GUI backend and are freed
+        together with the generator.
+        """
+        fig = Figure(figsize=figsize, dpi=100)
+        FigureCanvasAgg(fig)
+        return fig
+    
+    def _format_time_axis(self, ax, hour_interval: int):
+        """Label an x axis with rotated HH:MM ticks every hour_interval hours.
         
-        # Bar chart for current prices
-        bars = ax1.bar(symbols, current_prices, color=colors, alpha=0.8, edgecolor='white', linewidth=2)
+        A fixed HourLocator replaces the default AutoDateLocator, which builds
+        a new locator on every draw. Formatters and locators bind to a single
+        axis, so each axis gets its own pair, created once.
+        """
+        ax.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M'))
+        ax.xaxis.set_major_locator(mdates.HourLocator(interval=hour_interval))
+        ax.tick_params(axis='x', labelrotation=45)
+    
+    def _init_current_prices_figure(self):
+        """Build the current prices figure and cache the artists updated each cycle."""
+        fig = self._new_figure((12, 8))
+        ax1, ax2 = fig.subplots(2, 1, gridspec_kw={'height_ratios': [3, 1]})
+        fig.subplots_adjust(left=0.08, right=0.97, top=0.9, bottom=0.1, hspace=0.35)
+        fig.suptitle('Precious Metals - Current Prices', fontsize=16, fontweight='bold')
         
-        # Add value labels on bars
-        for bar, price in zip(bars, current_prices):
-            height = bar.get_height()
-            ax1.text(bar.get_x() + bar.get_width()/2., height + height*0.01,
-                    f'${price:,.2f}', ha='center', va='bottom', fontweight='bold')
+        colors = [SYMBOL_COLORS[sym] for sym in SYMBOLS]
         
+        # Bar chart for current prices
+        self._price_bars, self._price_labels = self._init_value_bars(
+            ax1, SYMBOLS, colors, {'fontweight': 'bold'},
+            alpha=0.8, edgecolor='white', linewidth=2
+        )
         ax1.set_ylabel('Price (USD)', fontsize=12)
         ax1.set_title('Current Spot Prices', fontsize=14)
         ax1.grid(True, alpha=0.3)
-        ax1.set_ylim(bottom=0)
-        
-        # Bar chart for 24h changes
-        change_colors = [self.colors['positive'] if change >= 0 else self.colors['negative'] 
-                        for change in changes_24h]
-        
-        bars2 = ax2.bar(symbols, changes_24h, color=change_colors, alpha=0.8, edgecolor='white', linewidth=1)
-        
-        # Add percentage labels
-        for bar, change, price in zip(bars2, changes_24h, current_prices):
-            height = bar.get_height()
-            pct_change = (change / (price - change)) * 100 if price != change else 0
-            ax2.text(bar.get_x() + bar.get_width()/2., 
-                    height + (0.01 if height >= 0 else -0.01),
-                    f'{pct_change:+.2f}%', ha='center', 
-                    va='bottom' if height >= 0 else 'top', fontweight='bold')
         
+        # Bar chart for 24h changes (colored by sign on update)
+        self._change_bars, self._change_labels = self._init_value_bars(
+            ax2, SYMBOLS, self.colors['positive'], {'fontweight': 'bold'},
+            alpha=0.8, edgecolor='white', linewidth=1
+        )
         ax2.set_ylabel('24h Change (USD)', fontsize=12)
         ax2.set_title('24 Hour Changes', fontsize=14)
         ax2.grid(True, alpha=0.3)
         ax2.axhline(y=0, color='white', linestyle='-', alpha=0.5)
         
-        # Add market status
-        now = self.get_current_utc_time()
-        open_markets = [m.name for m in self.market_hours if self.is_market_open(m)]
-        status_text = f"Markets Open: {', '.join(open_markets) if open_markets else 'None'}"
-        fig.text(0.5, 0.02, status_text, ha='center', fontsize=10, 
-                style='italic', color=self.colors['text'])
-        
-        # Add timestamp
-        timestamp = now.strftime('%Y-%m-%d %H:%M:%S UTC')
-        fig.text(0.99, 0.02, f'Updated: {timestamp}', ha='right', fontsize=9, 
-                style='italic', color=self.colors['text'])
+        # Market status and timestamp
+        self._status_text = fig.text(0.5, 0.02, '', ha='center', fontsize=10, 
+                                     style='italic', color=self.colors['text'])
+        self._timestamp_text = fig.text(0.99, 0.02, '', ha='right', fontsize=9, 
+                                        style='italic', color=self.colors['text'])
         
-        plt.tight_layout()
-        plt.savefig(self.current_prices_file, dpi=100, bbox_inches='tight', 
-                   facecolor=self.colors['background'])
-        plt.close()
-        
-        logger.info(f"Generated current prices graph: {self.current_prices_file}")
-        return self.current_prices_file
+        self._current_fig = fig
+        self._current_axes = (ax1, ax2)
     
-    def generate_price_history_graph(self, hours: int = 24) -> str:
-        """Generate a graph showing price history over the specified hours."""
-        if not self.price_history:
-            logger.warning("No price history available")
-            return self.price_history_file
-        
-        # Create figure
-        fig, ax = plt.subplots(figsize=(14, 8))
-        fig.suptitle(f'Precious Metals - Price History (Last {hours} Hours)', 
-                    fontsize=16, fontweight='bold')
-        
-        # Calculate time range
-        end_time = self.get_current_utc_time()
-        start_time = end_time - timedelta(hours=hours)
-        
-        # Add market hours background
-        self.add_market_hours_background(ax, start_time, end_time)
-        
-        # Plot each metal's price history
-        symbol_colors = {
-            'XAU': self.colors['gold'],
-            'XAG': self.colors['silver'],
-            'XPT': self.colors['platinum'],
-            'XPD': self.colors['palladium']
-        }
-        
-        symbol_names = {
-            'XAU': 'Gold',
-            'XAG': 'Silver',
-            'XPT': 'Platinum',
-            'XPD': 'Palladium'
-        }
-        
-        for symbol, history in self.price_history.items():
-            if not history:
-                continue
+    def _init_price_history_figure(self):
+        """Build the price history figure with one line and annotation per metal."""
+        fig = self._new_figure((14, 8))
+        ax = fig.subplots()
+        fig.subplots_adjust(left=0.07, right=0.97, top=0.9, bottom=0.14)
+        self._history_title = fig.suptitle('', fontsize=16, fontweight='bold')
+        ax.xaxis_date()
+        
+        self._history_lines = {}
+        self._history_annotations = {}
+        for symbol in SYMBOLS:
+            color = SYMBOL_COLORS[symbol]
+            self._history_lines[symbol], = ax.plot([], [], color=color, linewidth=2, 
+                                                   label=SYMBOL_NAMES[symbol], alpha=0.9)
             
-            # Filter data within time range
-            filtered_data = [(t, p) for t, p in history if t >= start_time]
-            if not filtered_data:
-                continue
-            
-            times, prices = zip(*filtered_data)
-            color = symbol_colors.get(symbol, '#FFFFFF')
-            name = symbol_names.get(symbol, symbol)
-            
-            ax.plot(times, prices, color=color, linewidth=2, label=name, alpha=0.9)
-            
-            # Add latest price annotation
-            latest_time, latest_price = filtered_data[-1]
-            ax.annotate(f'{name}: ${latest_price:.2f}',
-                       xy=(latest_time, latest_price),
-                       xytext=(10, 5), textcoords='offset points',
-                       color=color, fontweight='bold',
-                       bbox=dict(boxstyle='round,pad=0.3', facecolor=color, alpha=0.3))
+            annotation = ax.annotate('', xy=(0, 0),
+                                     xytext=(10, 5), textcoords='offset points',
+                                     color=color, fontweight='bold',
+                                     bbox=dict(boxstyle='round,pad=0.3', facecolor=color, alpha=0.3))
+            annotation.set_visible(False)
+            self._history_annotations[symbol] = annotation
+        
+        # Market hours spans are replaced on every update
+        self._history_spans = []
         
         # Formatting
         ax.set_xlabel('Time (UTC)', fontsize=12)
         ax.set_ylabel('Price (USD)', fontsize=12)
         ax.set_title('Price Trends', fontsize=14)
         ax.grid(True, alpha=0.3)
-        ax.legend(loc='upper left', framealpha=0.9)
         
         # Format x-axis
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M'))
-        ax.xaxis.set_major_locator(mdates.HourLocator(interval=2))
-        plt.setp(ax.xaxis.get_majorticklabels(), rotation=45)
-        
-        # Add market legend
-        legend_elements = []
-        for market in self.market_hours:
-            is_open = self.is_market_open(market)
-            status = "OPEN" if is_open else "CLOSED"
-            alpha = 1.0 if is_open else 0.3
-            legend_elements.append(plt.Rectangle((0, 0), 1, 1, fc=market.color, 
-                                               alpha=market.alpha, label=f'{market.name} {status}'))
-        
-        ax.legend(handles=legend_elements, loc='upper right', framealpha=0.9)
+        self._format_time_axis(ax, hour_interval=2)
         
-        # Add timestamp
-        timestamp = self.get_current_utc_time().strftime('%Y-%m-%d %H:%M:%S UTC')
-        fig.text(0.99, 0.02, f'Updated: {timestamp}', ha='right', fontsize=9, 
-                style='italic', color=self.colors['text'])
+        # Add market legend (labels carry the open/closed status)
+        legend_elements = [plt.Rectangle((0, 0), 1, 1, fc=market.color, 
+                                         alpha=market.alpha, label=market.name)
+                           for market in self.market_hours]
+        self._market_legend = ax.legend(handles=legend_elements, loc='upper right', framealpha=0.9)
         
-        plt.tight_layout()
-        plt.savefig(self.price_history_file, dpi=100, bbox_inches='tight', 
-                   facecolor=self.colors['background'])
-        plt.close()
+        self._history_timestamp = fig.text(0.99, 0.02, '', ha='right', fontsize=9, 
+                                           style='italic', color=self.colors['text'])
         
-        logger.info(f"Generated price history graph: {self.price_history_file}")
-        return self.price_history_file
+        self._history_fig = fig
+        self._history_ax = ax
     
-    def generate_market_overview(self) -> str:
-        """Generate a comprehensive market overview dashboard."""
-        # Get current prices
-        prices = self.market_data_fetcher.fetch_prices()
-        
-        if not prices:
-            logger.warning("No price data available for market overview")
-            return self.market_overview_file
-        
-        # Create figure with subplots
-        fig = plt.figure(figsize=(16, 10))
+    def _init_market_overview_figure(self):
+        """Build the market overview dashboard and cache its per-panel artists."""
+        fig = self._new_figure((16, 10))
         fig.suptitle('Precious Metals Market Overview', fontsize=18, fontweight='bold')
         
-        # Create grid layout
-        gs = fig.add_gridspec(3, 3, hspace=0.3, wspace=0.3)
+        # Create grid layout (margins leave room for the rotated time labels)
+        gs = fig.add_gridspec(3, 3, hspace=0.45, wspace=0.3, 
+                              left=0.05, right=0.98, top=0.92, bottom=0.08)
+        colors = [SYMBOL_COLORS[sym] for sym in SYMBOLS]
         
         # 1. Current prices (top, spanning 2 columns)
         ax1 = fig.add_subplot(gs[0, :2])
-        self._plot_mini_prices(ax1, prices)
-        
-        # 2. Market status (top right)
+        self._mini_price_bars, self._mini_price_labels = self._init_value_bars(
+            ax1, [SYMBOL_NAMES[sym] for sym in SYMBOLS], colors,
+            {'fontsize': 9, 'fontweight': 'bold'}, alpha=0.8
+        )
+        ax1.set_title('Current Prices', fontsize=12, fontweight='bold')
+        ax1.set_ylabel('USD', fontsize=10)
+        
+        # 2. Market status (top right), one text slot per market
         ax2 = fig.add_subplot(gs[0, 2])
-        self._plot_market_status(ax2)
+        ax2.set_title('Market Status', fontsize=12, fontweight='bold')
+        ax2.axis('off')
+        self._market_status_slots = [
+            ax2.text(0.5, 0.9 - i * 0.25, '', ha='center', va='center', fontsize=10)
+            for i in range(len(self.market_hours))
+        ]
         
         # 3. Price history (middle, spanning all columns)
         ax3 = fig.add_subplot(gs[1, :])
-        self._plot_mini_history(ax3, hours=12)
+        ax3.xaxis_date()
+        self._mini_history_lines = {
+            symbol: ax3.plot([], [], color=SYMBOL_COLORS[symbol], linewidth=2, 
+                             label=SYMBOL_NAMES[symbol], alpha=0.9)[0]
+            for symbol in SYMBOLS
+        }
+        self._mini_history_empty = ax3.text(0.5, 0.5, 'No history data', ha='center', va='center', 
+                                            transform=ax3.transAxes, fontsize=12)
+        ax3.set_ylabel('USD', fontsize=10)
+        ax3.grid(True, alpha=0.3)
+        ax3.legend(loc='upper left', framealpha=0.9)
+        self._format_time_axis(ax3, hour_interval=2)
         
         # 4. 24h changes (bottom left)
         ax4 = fig.add_subplot(gs[2, 0])
-        self._plot_changes(ax4, prices, '24h')
-        
-        # 5. Volume indicator (bottom middle)
+        self._mini_change_bars, self._mini_change_labels = self._init_value_bars(
+            ax4, SYMBOLS, self.colors['positive'], {'fontsize': 9}, alpha=0.8
+        )
+        ax4.set_title('24h Changes', fontsize=12, fontweight='bold')
+        ax4.set_ylabel('USD', fontsize=10)
+        ax4.axhline(y=0, color='white', linestyle='-', alpha=0.5)
+        ax4.grid(True, alpha=0.3)
+        
+        # 5. Volume indicator (bottom middle, static)
         ax5 = fig.add_subplot(gs[2, 1])
         self._plot_volume_indicator(ax5)
         
-        # 6. News ticker preview (bottom right)
+        # 6. News ticker preview (bottom right, static), top 3 headlines
         ax6 = fig.add_subplot(gs[2, 2])
-        self._plot_news_preview(ax6)
+        ax6.set_title('Latest News', fontsize=12, fontweight='bold')
+        ax6.axis('off')
+        self._news_slots = [
+            ax6.text(0.05, 0.9 - i * 0.25, '', va='center', fontsize=8, wrap=True)
+            for i in range(3)
+        ]
+        self._update_news_preview(PLACEHOLDER_HEADLINES)
         
-        # Add timestamp
-        timestamp = self.get_current_utc_time().strftime('%Y-%m-%d %H:%M:%S UTC')
-        fig.text(0.99, 0.01, f'Updated: {timestamp}', ha='right', fontsize=9, 
-                style='italic', color=self.colors['text'])
+        self._overview_timestamp = fig.text(0.99, 0.01, '', ha='right', fontsize=9, 
+                                            style='italic', color=self.colors['text'])
         
-        plt.tight_layout()
-        plt.savefig(self.market_overview_file, dpi=100, bbox_inches='tight', 
-                   facecolor=self.colors['background'])
-        plt.close()
+        self._overview_fig = fig
+        self._overview_axes = {
+            'prices': ax1, 'status': ax2, 'history': ax3,
+            'changes': ax4, 'volume': ax5, 'news': ax6
+        }
         
-        logger.info(f"Generated market overview: {self.market_overview_file}")
-        return self.market_overview_file
+        # Artists that change every update are left out of the full draw and
+        # blitted over a cached background of everything else
+        self._overview_dynamic = [
+            *self._mini_price_bars, *self._mini_price_labels,
+            *self._mini_history_lines.values(), self._mini_history_empty,
+            *self._mini_change_bars, *self._mini_change_labels,
+            self._overview_timestamp
+        ]
+        for artist in self._overview_dynamic:
+            artist.set_animated(True)
+        self._overview_background = None
+        self._overview_background_key = None
     
-    def _plot_mini_prices(self, ax, prices):
-        """Plot mini current prices display."""
-        symbols = list(prices.keys())
-        current_prices = [prices[sym].price for sym in symbols]
+    def _unchanged(self, name: str, key: tuple) -> bool:
+        """Check whether a graph was already rendered from key, and remember key if not."""
+        if self._render_keys.get(name) == key and os.path.exists(getattr(self, f'{name}_file')):
+            logger.debug(f"Inputs unchanged, skipping {name} graph")
+            return True
+        self._render_keys[name] = key
+        return False
+    
+    def _price_key(self, state: RenderState) -> tuple:
+        """Get the key of the price data and market status in state."""
+        return (state.prices.tobytes(), state.changes.tobytes(), state.present.tobytes(), state.market_open)
+    
+    def generate_current_prices_graph(self, state: RenderState) -> str:
+        """Generate a graph showing current prices with 24h changes."""
+        if self._unchanged('current_prices', self._price_key(state)):
+            return self.current_prices_file
         
-        symbol_colors = {
-            'XAU': self.colors['gold'],
-            'XAG': self.colors['silver'],
-            'XPT': self.colors['platinum'],
-            'XPD': self.colors['palladium']
-        }
+        # Percentage labels for the 24h changes (metals missing from this update draw as empty bars)
+        previous = state.prices - state.changes
+        pct_changes = np.divide(state.changes * 100.0, previous, 
+                                out=np.zeros_like(previous), where=previous != 0)
+        pct_labels = [f'{pct:+.2f}%' if shown else '' 
+                      for pct, shown in zip(pct_changes.tolist(), state.present.tolist())]
         
-        colors = [symbol_colors.get(sym, '#FFFFFF') for sym in symbols]
-        symbol_names = ['Gold', 'Silver', 'Platinum', 'Palladium']
+        ax1, ax2 = self._current_axes
+        self._update_price_bars(ax1, self._price_bars, self._price_labels, state.prices, state.price_labels)
+        self._update_change_bars(ax2, self._change_bars, self._change_labels, state.changes, pct_labels)
         
-        bars = ax.bar(symbol_names, current_prices, color=colors, alpha=0.8)
-        ax.set_title('Current Prices', fontsize=12, fontweight='bold')
-        ax.set_ylabel('USD', fontsize=10)
+        # Update market status
+        open_markets = [m.name for m, is_open in zip(self.market_hours, state.market_open) if is_open]
+        self._status_text.set_text(f"Markets Open: {', '.join(open_markets) if open_markets else 'None'}")
         
-        # Add value labels
-        for bar, price in zip(bars, current_prices):
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height + height*0.01,
-                   f'${price:,.2f}', ha='center', va='bottom', fontsize=9, fontweight='bold')
-    
-    def _plot_market_status(self, ax):
-        """Plot market status indicators."""
-        ax.set_title('Market Status', fontsize=12, fontweight='bold')
-        ax.axis('off')
+        # Update timestamp
+        timestamp = state.now.strftime('%Y-%m-%d %H:%M:%S UTC')
+        self._timestamp_text.set_text(f'Updated: {timestamp}')
         
-        y_pos = 0.9
-        for market in self.market_hours:
-            is_open = self.is_market_open(market)
-            status = "● OPEN" if is_open else "○ CLOSED"
-            color = market.color if is_open else '#666666'
-            
-            ax.text(0.5, y_pos, f'{market.name}: {status}', 
-                   ha='center', va='center', fontsize=10,
-                   color=color, fontweight='bold' if is_open else 'normal')
-            y_pos -= 0.25
-    
-    def _plot_mini_history(self, ax, hours):
-        """Plot mini price history."""
-        if not self.price_history:
-            ax.text(0.5, 0.5, 'No history data', ha='center', va='center', 
-                   transform=ax.transAxes, fontsize=12)
-            return
+        self._save_figure(self._current_fig, self.current_prices_file)
         
-        end_time = self.get_current_utc_time()
-        start_time = end_time - timedelta(hours=hours)
+        logger.info(f"Generated current prices graph: {self.current_prices_file}")
+        return self.current_prices_file
+    
+    def generate_price_history_graph(self, state: RenderState, hours: int = 24) -> str:
+        """Generate a graph showing price history over the specified hours."""
+        if not self._filled:
+            logger.warning("No price history available")
+            return self.price_history_file
         
-        symbol_colors = {
-            'XAU': self.colors['gold'],
-            'XAG': self.colors['silver'],
-            'XPT': self.colors['platinum'],
-            'XPD': self.colors['palladium']
-        }
+        # The history only changes when a point is added
+        if self._unchanged('price_history', (self._head, self._filled, hours, state.market_open)):
+            return self.price_history_file
         
-        symbol_names = {
-            'XAU': 'Gold',
-            'XAG': 'Silver',
-            'XPT': 'Platinum',
-            'XPD': 'Palladium'
-        }
+        ax = self._history_ax
+        self._history_title.set_text(f'Precious Metals - Price History (Last {hours} Hours)')
         
-        for symbol, history in self.price_history.items():
-            if not history:
-                continue
-            
-            filtered_data = [(t, p) for t, p in history if t >= start_time]
-            if not filtered_data:
+        # Calculate time range
+        end_time = state.now
+        start_time = end_time - timedelta(hours=hours)
+        
+        # Replace the market hours background for the new time range
+        for span in self._history_spans:
+            span.remove()
+        self._history_spans = self.add_market_hours_background(ax, start_time, end_time)
+        
+        # Update each metal's price line and latest price annotation
+        width_px = int(ax.bbox.width)
+        start_ts = start_time.timestamp()
+        for symbol, line in self._history_lines.items():
+            annotation = self._history_annotations[symbol]
+            window = self._history_window(symbol, start_ts, width_px)
+            if window is None:
+                line.set_data([], [])
+                annotation.set_visible(False)
                 continue
             
-            times, prices = zip(*filtered_data)
-            color = symbol_colors.get(symbol, '#FFFFFF')
-            name = symbol_names.get(symbol, symbol)
-            
-            ax.plot(times, prices, color=color, linewidth=2, label=name, alpha=0.9)
+            times, prices = window
+            line.set_data(times, prices)
+            latest = np.flatnonzero(~np.isnan(prices))[-1]
+            annotation.set_text(f'{SYMBOL_NAMES[symbol]}: ${prices[latest]:.2f}')
+            annotation.xy = (times[latest], prices[latest])
+            annotation.set_visible(True)
+        
+        ax.relim()
+        ax.autoscale_view()
+        
+        # Update market legend
+        for text, market, is_open in zip(self._market_legend.get_texts(), self.market_hours, state.market_open):
+            status = "OPEN" if is_open else "CLOSED"
+            text.set_text(f'{market.name} {status}')
         
-        ax.set_title(f'Price Trends (Last {hours}h)', fontsize=12, fontweight='bold')
-        ax.set_ylabel('USD', fontsize=10)
-        ax.grid(True, alpha=0.3)
-        ax.legend(loc='upper left', framealpha=0.9)
+        # Update timestamp
+        timestamp = end_time.strftime('%Y-%m-%d %H:%M:%S UTC')
+        self._history_timestamp.set_text(f'Updated: {timestamp}')
         
-        # Format x-axis
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M'))
-        plt.setp(ax.xaxis.get_majorticklabels(), rotation=45)
+        self._save_figure(self._history_fig, self.price_history_file)
+        
+        logger.info(f"Generated price history graph: {self.price_history_file}")
+        return self.price_history_file
     
-    def _plot_changes(self, ax, prices, period):
-        """Plot price changes."""
-        symbols = list(prices.keys())
-        changes = [prices[sym].change_24h or 0 for sym in symbols]
+    def generate_market_overview(self, state: RenderState) -> str:
+        """Generate a comprehensive market overview dashboard."""
+        if self._unchanged('market_overview', (self._price_key(state), self._head, self._filled)):
+            return self.market_overview_file
         
-        change_colors = [self.colors['positive'] if change >= 0 else self.colors['negative'] 
-                        for change in changes]
+        axes = self._overview_axes
         
-        bars = ax.bar(symbols, changes, color=change_colors, alpha=0.8)
-        ax.set_title(f'{period} Changes', fontsize=12, fontweight='bold')
-        ax.set_ylabel('USD', fontsize=10)
-        ax.axhline(y=0, color='white', linestyle='-', alpha=0.5)
-        ax.grid(True, alpha=0.3)
+        # 1. Current prices
+        self._update_price_bars(axes['prices'], self._mini_price_bars, self._mini_price_labels, 
+                                state.prices, state.price_labels)
+        
+        # 3. Price history
+        self._update_mini_history(hours=12, now=state.now)
+        
+        # 4. 24h changes
+        change_labels = [f'{change:+.2f}' if shown else '' 
+                         for change, shown in zip(state.changes.tolist(), state.present.tolist())]
+        self._update_change_bars(axes['changes'], self._mini_change_bars, self._mini_change_labels, 
+                                 state.changes, change_labels)
+        
+        # Update timestamp
+        timestamp = state.now.strftime('%Y-%m-%d %H:%M:%S UTC')
+        self._overview_timestamp.set_text(f'Updated: {timestamp}')
+        
+        # 2. Market status is part of the background, so it is only redrawn
+        # along with it when the status or any axis limits change
+        background_key = (
+            state.market_open,
+            axes['history'].get_title(),
+            *(axes[name].get_xlim() + axes[name].get_ylim() for name in ('prices', 'history', 'changes'))
+        )
+        self._blit_overview(background_key, state.market_open)
+        
+        logger.info(f"Generated market overview: {self.market_overview_file}")
+        return self.market_overview_file
+    
+    def _blit_overview(self, background_key: tuple, market_open: Tuple[bool, ...]):
+        """Draw the dynamic overview artists over the cached background and save it."""
+        fig = self._overview_fig
+        canvas = fig.canvas
+        
+        if background_key != self._overview_background_key:
+            self._update_market_status(market_open)
+            canvas.draw()
+            self._overview_background = canvas.copy_from_bbox(fig.bbox)
+            self._overview_background_key = background_key
+        else:
+            canvas.restore_region(self._overview_background)
+        
+        for artist in self._overview_dynamic:
+            fig.draw_artist(artist)
         
-        # Add value labels
-        for bar, change in zip(bars, changes):
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., 
-                   height + (0.01 if height >= 0 else -0.01),
-                   f'{change:+.2f}', ha='center', 
-                   va='bottom' if height >= 0 else 'top', fontsize=9)
+        mpimg.imsave(self.market_overview_file, np.asarray(canvas.buffer_rgba()))
+    
+    def _update_market_status(self, market_open: Tuple[bool, ...]):
+        """Update the market status indicators."""
+        for slot, market, is_open in zip(self._market_status_slots, self.market_hours, market_open):
+            status = "● OPEN" if is_open else "○ CLOSED"
+            slot.set_text(f'{market.name}: {status}')
+            slot.set_color(market.color if is_open else '#666666')
+            slot.set_fontweight('bold' if is_open else 'normal')
+    
+    def _update_mini_history(self, hours, now: datetime):
+        """Update the mini price history lines."""
+        ax = self._overview_axes['history']
+        ax.set_title(f'Price Trends (Last {hours}h)', fontsize=12, fontweight='bold')
+        
+        start_ts = now.timestamp() - hours * 3600
+        
+        low, high = np.inf, -np.inf
+        width_px = int(ax.bbox.width)
+        for symbol, line in self._mini_history_lines.items():
+            window = self._history_window(symbol, start_ts, width_px)
+            line.set_data(*(window or ([], [])))
+            if window is not None:
+                low = min(low, np.nanmin(window[1]))
+                high = max(high, np.nanmax(window[1]))
+        
+        self._mini_history_empty.set_visible(not self._filled)
+        
+        # Whole-hour and rounded limits keep the axes steady between updates
+        end_hour = math.ceil(now.timestamp() / 3600)
+        ax.set_xlim((end_hour - hours - 1) / 24 + _EPOCH_DATENUM, end_hour / 24 + _EPOCH_DATENUM)
+        if low <= high:
+            ax.set_ylim(*_nice_bounds(low, high))
     
     def _plot_volume_indicator(self, ax):
         """Plot a mock volume indicator (placeholder)."""
@@ -487,43 +767,37 @@ class GraphGenerator:
         
         ax.bar(times, volumes, color=self.colors['grid'], alpha=0.6)
         ax.set_ylabel('Activity Index', fontsize=10)
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M'))
-        plt.setp(ax.xaxis.get_majorticklabels(), rotation=45)
+        self._format_time_axis(ax, hour_interval=3)
         ax.grid(True, alpha=0.3)
     
-    def _plot_news_preview(self, ax):
-        """Plot news preview placeholder."""
-        ax.set_title('Latest News', fontsize=12, fontweight='bold')
-        ax.axis('off')
-        
-        # Mock news headlines
-        headlines = [
-            "Gold prices steady amid Fed uncertainty",
-            "Silver demand rises in solar sector",
-            "Platinum supply concerns persist",
-            "Central banks continue gold purchases"
-        ]
-        
-        y_pos = 0.9
-        for headline in headlines[:3]:  # Show top 3
-            ax.text(0.05, y_pos, f'• {headline[:25]}...', 
-                   va='center', fontsize=8, wrap=True)
-            y_pos -= 0.25
+    def _update_news_preview(self, headlines: List[str]):
+        """Show the first headlines in the news preview, blanking unused slots."""
+        for i, slot in enumerate(self._news_slots):
+            slot.set_text(f'• {headlines[i][:25]}...' if i < len(headlines) else '')
     
-    def update_all_graphs(self) -> Dict[str, str]:
-        """Update all graphs and return the file paths."""
+    def update_all_graphs(self, prices: Optional[Dict[str, MetalPrice]] = None) -> Dict[str, str]:
+        """Update all graphs and return the file paths.
+        
+        Args:
+            prices: Current prices, fetched here if not supplied
+        """
         # Get current prices
-        prices = self.market_data_fetcher.fetch_prices()
+        if prices is None:
+            prices = self.market_data_fetcher.fetch_prices()
         
         if prices:
+            # One clock reading for the whole update
+            now = self.get_current_utc_time()
+            
             # Update price history
-            self.update_price_history(prices)
+            self.update_price_history(prices, now)
             
-            # Generate all graphs
+            # Generate all graphs from one shared snapshot of the data
+            state = self._extract_render_state(prices, now)
             graphs = {
-                'current_prices': self.generate_current_prices_graph(prices),
-                'price_history': self.generate_price_history_graph(),
-                'market_overview': self.generate_market_overview()
+                'current_prices': self.generate_current_prices_graph(state),
+                'price_history': self.generate_price_history_graph(state),
+                'market_overview': self.generate_market_overview(state)
             }
             
             logger.info(f"Updated all graphs: {list(graphs.keys())}")
@@ -532,18 +806,30 @@ class GraphGenerator:
             logger.warning("No price data available to update graphs")
             return {}
     
-    def save_graph_metadata(self, graphs: Dict[str, str]):
-        """Save metadata about generated graphs."""
+    def save_graph_metadata(self, graphs: Dict[str, str], now: Optional[datetime] = None):
+        """Save metadata about generated graphs.
+        
+        The file is only rewritten when the graphs or market status change,
+        so its timestamp records the last change.
+        """
+        now = now or self.get_current_utc_time()
+        market_status = {m.name: self.is_market_open(m, now) for m in self.market_hours}
+        
+        key = (tuple(graphs.items()), tuple(market_status.values()))
+        if key == self._last_metadata_key:
+            return
+        
         metadata = {
-            'timestamp': self.get_current_utc_time().isoformat(),
+            'timestamp': now.isoformat(),
             'graphs': graphs,
-            'market_status': {m.name: self.is_market_open(m) for m in self.market_hours}
+            'market_status': market_status
         }
         
         metadata_file = os.path.join(self.output_dir, 'graph_metadata.json')
         try:
-            with open(metadata_file, 'w') as f:
-                json.dump(metadata, f, indent=2)
+            with open(metadata_file, 'wb') as f:
+                f.write(dumps(metadata))
+            self._last_metadata_key = key
         except Exception as e:
             logger.error(f"Error saving graph metadata: {e}")
 
@@ -4,8 +4,11 @@ Silver Ronin - 24/7 Precious Metals Livestream
 Main application entry point.
 """
 import os
+import argparse
 import logging
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from loguru import logger
 from dotenv import load_dotenv
@@ -13,6 +16,10 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
+# Graphs are only written to files, so render headless with Agg unless
+# a backend is configured explicitly (must be set before matplotlib loads)
+os.environ.setdefault('MPLBACKEND', 'Agg')
+
 # Configure logging
 logger.add(
     os.path.join(os.getenv('LOGS_DIR', 'logs'), 'silver_ronin.log'),
@@ -24,10 +31,16 @@ logger.add(
 class SilverRonin:
     """Main application class for Silver Ronin livestream."""
     
-    def __init__(self):
-        """Initialize the application."""
+    def __init__(self, pretty_logs: bool = False):
+        """Initialize the application.
+        
+        Args:
+            pretty_logs: Indent the JSON commentary snapshot written on shutdown
+        """
         self.running = False
+        self.pretty_logs = pretty_logs
         self.update_interval = int(os.getenv('UPDATE_INTERVAL', '60'))
+        self._stop = threading.Event()
         
         # Import components
         from .data_fetchers import get_market_data_fetcher, get_news_fetcher
@@ -40,6 +53,9 @@ class SilverRonin:
         self.graph_generator = get_graph_generator()
         self.tts_engine = get_tts_engine()
         
+        # Workers for running the fetches, and then the renders, side by side
+        self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='silver_ronin')
+        
         logger.info("Silver Ronin initialized")
     
     def setup(self):
@@ -77,23 +93,28 @@ class SilverRonin:
         try:
             logger.debug("Updating components...")
             
-            # Update market data
-            prices = self.market_data_fetcher.fetch_prices()
+            # Update market data and news concurrently (both are network bound)
+            prices_future = self._pool.submit(self.market_data_fetcher.fetch_prices)
+            news_future = self._pool.submit(self.news_fetcher.fetch_news, max_articles=10)
+            
+            prices = prices_future.result()
             if prices:
                 logger.debug(f"Updated prices: {list(prices.keys())}")
             
-            # Update news
-            articles = self.news_fetcher.fetch_news(max_articles=10)
+            articles = news_future.result()
             if articles:
                 logger.debug(f"Updated news: {len(articles)} articles")
             
-            # Update graphs
-            graphs = self.graph_generator.update_all_graphs()
+            # Render graphs and audio concurrently (Agg and audio encoding release the GIL),
+            # both from this cycle's data so neither fetches again
+            graphs_future = self._pool.submit(self.graph_generator.update_all_graphs, prices)
+            tts_future = self._pool.submit(self.tts_engine.update_all, prices, articles)
+            
+            graphs = graphs_future.result()
             if graphs:
                 logger.debug(f"Updated graphs: {list(graphs.keys())}")
             
-            # Update TTS
-            tts_status = self.tts_engine.update_all()
+            tts_status = tts_future.result()
             if tts_status['audio_files_generated'] > 0:
                 logger.info(f"Generated {tts_status['audio_files_generated']} audio files")
             
@@ -112,19 +133,28 @@ class SilverRonin:
         logger.info("Starting Silver Ronin livestream...")
         
         try:
-            while self.running:
-                start_time = time.time()
+            # Absolute deadlines on the monotonic clock keep the cadence from drifting
+            deadline = time.monotonic()
+            while self.running and not self._stop.is_set():
+                start_time = time.monotonic()
                 
                 # Update all components
                 if not self.update():
                     logger.warning("Update cycle had errors")
                 
-                # Calculate sleep time to maintain update interval
-                elapsed = time.time() - start_time
-                sleep_time = max(1, self.update_interval - elapsed)
+                deadline += self.update_interval
+                now = time.monotonic()
+                elapsed = now - start_time
+                sleep_time = deadline - now
+                if sleep_time < 0:
+                    # Overran the interval: start the next cycle now instead of bursting to catch up
+                    logger.warning(f"Update took {elapsed:.2f}s, longer than the {self.update_interval}s interval")
+                    deadline = now
+                    sleep_time = 0
                 
                 logger.debug(f"Update completed in {elapsed:.2f}s. Sleeping for {sleep_time:.2f}s")
-                time.sleep(sleep_time)
+                if self._stop.wait(sleep_time):
+                    break
                 
         except KeyboardInterrupt:
             logger.info("Shutting down gracefully...")
@@ -137,7 +167,14 @@ class SilverRonin:
         """Clean up resources and shut down the application."""
         logger.info("Shutting down...")
         self.running = False
+        self._stop.set()
+        self._pool.shutdown(wait=True, cancel_futures=True)
+        self.tts_engine.close(pretty=self.pretty_logs)
 
 if __name__ == "__main__":
-    app = SilverRonin()
+    parser = argparse.ArgumentParser(description="Silver Ronin precious metals livestream")
+    parser.add_argument('--pretty', action='store_true', help="pretty-print JSON log snapshots")
+    args = parser.parse_args()
+    
+    app = SilverRonin(pretty_logs=args.pretty)
     app.run()
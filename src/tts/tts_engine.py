@@ -4,16 +4,29 @@ Supports multiple TTS backends and voice customization.
 """
 import os
 import time
+import heapq
+import hashlib
+import itertools
 import logging
-from typing import List, Dict, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, List, Dict, Optional, Tuple
 from datetime import datetime
 from dataclasses import dataclass
+from functools import cached_property
+from collections import OrderedDict
 from loguru import logger
-import json
 import random
+import re
+import numpy as np
+import string
+import base64
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 try:
     from gtts import gTTS
+    from gtts.tts import gTTSError
     GTTS_AVAILABLE = True
 except ImportError:
     GTTS_AVAILABLE = False
@@ -28,6 +41,37 @@ except ImportError:
 
 from ..data_fetchers.market_data import MetalPrice, get_market_data_fetcher
 from ..data_fetchers.news_fetcher import NewsArticle, get_news_fetcher
+from ..utils.jsonio import dumps
+
+# Concurrent gTTS requests, matched by the shared session's connection pool
+_GTTS_WORKERS = 4
+
+if GTTS_AVAILABLE:
+    class _SessionGTTS(gTTS):
+        """gTTS that sends its requests over a shared keep-alive session."""
+        
+        def __init__(self, *args, session: requests.Session, **kwargs):
+            super().__init__(*args, **kwargs)
+            self._session = session
+        
+        def stream(self):
+            """Yield decoded MP3 fragments, reusing the pooled connection."""
+            for pr in self._prepare_requests():
+                try:
+                    r = self._session.send(pr, stream=True, timeout=10)
+                    r.raise_for_status()
+                except requests.exceptions.HTTPError as e:
+                    raise gTTSError(tts=self, response=r) from e
+                except requests.exceptions.RequestException as e:
+                    raise gTTSError(tts=self) from e
+                
+                for line in r.iter_lines(chunk_size=1024):
+                    decoded_line = line.decode("utf-8")
+                    if "jQ1olc" in decoded_line:
+                        audio_search = re.search(r'jQ1olc","\[\\"(.*)\\"]', decoded_line)
+                        if not audio_search:
+                            raise gTTSError(tts=self, response=r)
+                        yield base64.b64decode(audio_search.group(1).encode("ascii"))
 
 @dataclass
 class CommentaryItem:
@@ -37,16 +81,21 @@ class CommentaryItem:
     category: str  # 'market', 'news', 'analysis'
     timestamp: datetime
     audio_file: Optional[str] = None
+    synthesized: bool = False
     
-    def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
+    @cached_property
+    def _fixed_fields(self) -> dict:
+        """Serialized form of the fields that never change after creation."""
         return {
             'text': self.text,
             'priority': self.priority,
             'category': self.category,
-            'timestamp': self.timestamp.isoformat(),
-            'audio_file': self.audio_file
+            'timestamp': self.timestamp.isoformat()
         }
+    
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {**self._fixed_fields, 'audio_file': self.audio_file}
 
 class TTSEngine:
     """Text-to-speech engine for generating avatar commentary."""
@@ -61,15 +110,52 @@ class TTSEngine:
         self.market_data_fetcher = get_market_data_fetcher()
         self.news_fetcher = get_news_fetcher()
         
+        # Shared graph generator for market hours; imported here to avoid a cycle at module load
+        from ..graphics.graph_generator import get_graph_generator
+        self._graph_gen = get_graph_generator()
+        self._market_status: Dict[str, bool] = {}
+        self._market_status_minute = -1
+        
         # Create output directory
         os.makedirs(output_dir, exist_ok=True)
         
+        # Shared HTTP session so gTTS reuses its TLS connection
+        self._http = requests.Session()
+        self._http.mount("https://", HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=_GTTS_WORKERS,
+            max_retries=Retry(total=2, backoff_factor=0.2)
+        ))
+        
+        # SAPI/eSpeak drivers are not reentrant and COM objects belong to the thread
+        # that created them, so every pyttsx3 call runs on this one worker thread
+        self._pyttsx3_worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix='pyttsx3')
+        
         # Initialize TTS engines
         self.engines = {}
         self._init_engines()
         
-        # Commentary queue
-        self.commentary_queue: List[CommentaryItem] = []
+        # Local pyttsx3 for short templated lines, gTTS where voice quality matters
+        self.engine_policy = {
+            'analysis': 'pyttsx3',
+            'market': 'pyttsx3',
+            'news': 'gtts'
+        }
+        self.short_text_chars = 100
+        
+        # Generated audio keyed by text and voice settings
+        self._audio_cache: Dict[str, str] = {}
+        self.audio_check_interval = 3600  # seconds between disk checks of generated audio
+        self._last_audio_check = time.time()
+        
+        # Append-only JSON Lines log of new commentary, reopened when the day changes
+        self._log_fh = None
+        self._log_day = None
+        self._closed = False
+        
+        # Commentary queue, a heap of (priority, timestamp, seq, item) entries
+        self.commentary_queue: List[Tuple[int, datetime, int, CommentaryItem]] = []
+        self._queue_seq = itertools.count()
         self.max_queue_size = 50
         
         # Voice settings
@@ -85,10 +171,10 @@ class TTSEngine:
             }
         }
         
-        # Commentary templates
-        self.templates = {
+        # Commentary templates, compiled once into render callables
+        raw_templates = {
             'price_movement': [
-                "Breaking: {metal} is now trading at ${price:.2f}, {change_direction} by ${abs_change):.2f} today.",
+                "Breaking: {metal} is now trading at ${price:.2f}, {change_direction} by ${abs_change:.2f} today.",
                 "Market update: {metal} prices {change_direction} to ${price:.2f}, showing {change_direction} momentum.",
                 "Precious metals alert: {metal} at ${price:.2f}, {change_direction} by {change_pct:.1f}% in the last 24 hours."
             ],
@@ -108,37 +194,84 @@ class TTSEngine:
                 "Looking at the charts, {metal} is demonstrating {pattern} behavior."
             ]
         }
+        self.templates: Dict[str, Tuple[Callable[..., str], ...]] = {
+            k: tuple(self._compile_template(t) for t in v) for k, v in raw_templates.items()
+        }
+        self._rng = random.Random()
         
         # Last commentary times (to avoid repetition)
         self.last_commentary = {
             'price_update': 0,
             'news_update': 0,
-            'market_status': 0
+            'market_status': 0,
+            'analysis': 0
+        }
+        
+        # Recently spoken lines, so identical text is not queued again within its category's TTL
+        self._recent_texts: OrderedDict[str, float] = OrderedDict()
+        self.max_recent_texts = 200
+        self.dedup_ttl = {
+            'analysis': 900,  # 15 minutes
+            'market': 600,    # 10 minutes
+            'news': 3600      # 1 hour
         }
         
         # Cooldown periods (seconds)
         self.cooldowns = {
             'price_update': 300,  # 5 minutes
             'news_update': 600,   # 10 minutes
-            'market_status': 1800  # 30 minutes
+            'market_status': 1800,  # 30 minutes
+            'analysis': 300       # 5 minutes
         }
     
+    @staticmethod
+    def _compile_template(template: str) -> Callable[..., str]:
+        """Validate a format string once and return a callable that renders it.
+        
+        Malformed templates raise here at startup instead of on every message.
+        """
+        for _, field, _, _ in string.Formatter().parse(template):
+            if field is not None and not field.isidentifier():
+                raise ValueError(f"Invalid template field {field!r} in: {template}")
+        
+        def render(**kwargs) -> str:
+            return template.format_map(kwargs)
+        
+        return render
+    
     def _init_engines(self):
         """Initialize available TTS engines."""
         if GTTS_AVAILABLE:
-            self.engines['gtts'] = gTTS
+            self.engines['gtts'] = _SessionGTTS
+            self._warm_gtts_connection()
             logger.info("Initialized gTTS engine")
         
         if PYTTSX3_AVAILABLE:
-            try:
-                self.engines['pyttsx3'] = pyttsx3.init()
-                logger.info("Initialized pyttsx3 engine")
-            except Exception as e:
-                logger.error(f"Failed to initialize pyttsx3: {e}")
+            # The driver itself starts on first use (see _get_pyttsx3)
+            self.engines['pyttsx3'] = None
         
         if not self.engines:
             logger.error("No TTS engines available. Please install gTTS or pyttsx3")
     
+    def _get_pyttsx3(self):
+        """Return the pyttsx3 driver, starting it on first use. Runs on the pyttsx3 worker."""
+        engine = self.engines.get('pyttsx3')
+        if engine is None:
+            try:
+                engine = self.engines['pyttsx3'] = pyttsx3.init()
+                logger.info("Initialized pyttsx3 engine")
+            except Exception:
+                self.engines.pop('pyttsx3', None)
+                raise
+        return engine
+    
+    def _warm_gtts_connection(self):
+        """Open the pooled connection to the gTTS host ahead of the first request."""
+        try:
+            self._http.head("https://translate.google.com", timeout=3)
+        except requests.exceptions.RequestException as e:
+            logger.debug(f"gTTS connection warm-up failed: {e}")
+    
     def generate_audio(self, text: str, engine: str = 'gtts', filename: str = None) -> Optional[str]:
         """Generate audio from text using specified engine.
         
@@ -154,110 +287,206 @@ class TTSEngine:
             logger.error(f"TTS engine '{engine}' not available")
             return None
         
-        # Generate filename if not provided
-        if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"commentary_{timestamp}_{hash(text) % 10000}.mp3"
-        
-        output_path = os.path.join(self.output_dir, filename)
+        # Identical text with identical voice settings maps to the same file; an
+        # explicit filename says nothing about its contents, so it is always rendered
+        key = None
+        if filename:
+            output_path = os.path.join(self.output_dir, filename)
+        else:
+            key, output_path, cached = self._lookup_audio(text, engine)
+            if cached:
+                return cached
         
         try:
             if engine == 'gtts':
-                return self._generate_gtts(text, output_path)
+                result = self._generate_gtts(text, output_path)
             elif engine == 'pyttsx3':
-                return self._generate_pyttsx3(text, output_path)
+                result = self._generate_pyttsx3(text, output_path)
+            else:
+                result = None
         except Exception as e:
             logger.error(f"Error generating audio with {engine}: {e}")
             return None
+        
+        if result and key:
+            self._audio_cache[key] = result
+        return result
+    
+    def _lookup_audio(self, text: str, engine: str) -> Tuple[str, str, Optional[str]]:
+        """Return the cache key, default output path and any existing audio file for text."""
+        key = self._audio_key(text, engine)
+        extension = 'wav' if engine == 'pyttsx3' else 'mp3'
+        output_path = os.path.join(self.output_dir, f"tts_{engine}_{key}.{extension}")
+        
+        # Only trust entries that point at the file named after this key
+        cached = self._audio_cache.get(key)
+        if cached != output_path:
+            cached = None
+            if os.path.exists(output_path):
+                cached = self._audio_cache[key] = output_path
+        return key, output_path, cached
+    
+    def _audio_key(self, text: str, engine: str) -> str:
+        """Build a deterministic cache key from normalized text and voice settings."""
+        settings = self.voice_settings.get(engine, {})
+        fingerprint = "_".join(str(settings[k]) for k in sorted(settings))
+        digest = hashlib.sha256(text.strip().lower().encode("utf-8")).hexdigest()[:16]
+        return f"{digest}_{fingerprint}" if fingerprint else digest
+    
+    def generate_audio_stream(self, text: str) -> Iterator[bytes]:
+        """Yield MP3 fragments from gTTS as each response is decoded."""
+        if 'gtts' not in self.engines:
+            raise RuntimeError("gTTS engine not available")
+        
+        tts = _SessionGTTS(
+            text=text,
+            lang=self.voice_settings['gtts']['lang'],
+            slow=self.voice_settings['gtts']['slow'],
+            tld=self.voice_settings['gtts']['tld'],
+            session=self._http
+        )
+        yield from tts.stream()
     
     def _generate_gtts(self, text: str, output_path: str) -> Optional[str]:
         """Generate audio using gTTS."""
+        partial_path = output_path + ".part"
         try:
-            tts = gTTS(
-                text=text,
-                lang=self.voice_settings['gtts']['lang'],
-                slow=self.voice_settings['gtts']['slow'],
-                tld=self.voice_settings['gtts']['tld']
-            )
-            tts.save(output_path)
+            # Write fragments as they stream in; the rename keeps half-written files out of the cache
+            with open(partial_path, 'wb') as f:
+                for chunk in self.generate_audio_stream(text):
+                    f.write(chunk)
+            os.replace(partial_path, output_path)
             logger.debug(f"Generated gTTS audio: {output_path}")
             return output_path
         except Exception as e:
             logger.error(f"gTTS generation failed: {e}")
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
             return None
     
     def _generate_pyttsx3(self, text: str, output_path: str) -> Optional[str]:
         """Generate audio using pyttsx3."""
-        try:
-            engine = self.engines['pyttsx3']
-            
-            # Set voice properties
-            engine.setProperty('rate', self.voice_settings['pyttsx3']['rate'])
-            engine.setProperty('volume', self.voice_settings['pyttsx3']['volume'])
-            
-            # Save to file
-            engine.save_to_file(text, output_path)
-            engine.runAndWait()
+        return self.generate_audio_batch_pyttsx3([(text, output_path)])[0]
+    
+    def generate_audio_batch_pyttsx3(self, items: List[Tuple[str, str]]) -> List[Optional[str]]:
+        """Render several texts with pyttsx3 in a single event loop run.
+        
+        Args:
+            items: (text, output_path) pairs
             
-            logger.debug(f"Generated pyttsx3 audio: {output_path}")
-            return output_path
+        Returns:
+            Output path for each item, or None where generation failed
+        """
+        if not items:
+            return []
+        
+        try:
+            self._pyttsx3_worker.submit(self._run_pyttsx3_batch, items).result()
         except Exception as e:
             logger.error(f"pyttsx3 generation failed: {e}")
-            return None
+            return [None] * len(items)
+        
+        results = []
+        for _, output_path in items:
+            if os.path.exists(output_path):
+                logger.debug(f"Generated pyttsx3 audio: {output_path}")
+                results.append(output_path)
+            else:
+                results.append(None)
+        return results
+    
+    def _is_repeat(self, item: CommentaryItem) -> bool:
+        """Return True if the same text was emitted within its TTL, else remember it."""
+        now_ts = item.timestamp.timestamp()
+        last = self._recent_texts.get(item.text)
+        if last is not None and now_ts - last < self.dedup_ttl.get(item.category, 300):
+            return True
+        
+        self._recent_texts[item.text] = now_ts
+        self._recent_texts.move_to_end(item.text)
+        if len(self._recent_texts) > self.max_recent_texts:
+            self._recent_texts.popitem(last=False)
+        return False
     
-    def generate_price_commentary(self, prices: Dict[str, MetalPrice]) -> List[CommentaryItem]:
+    def _run_pyttsx3_batch(self, items: List[Tuple[str, str]]):
+        """Queue every file, then pay the runAndWait start/stop cost once."""
+        engine = self._get_pyttsx3()
+        
+        # Set voice properties once for the whole batch
+        engine.setProperty('rate', self.voice_settings['pyttsx3']['rate'])
+        engine.setProperty('volume', self.voice_settings['pyttsx3']['volume'])
+        
+        for text, output_path in items:
+            engine.save_to_file(text, output_path)
+        engine.runAndWait()
+    
+    def generate_price_commentary(self, prices: Dict[str, MetalPrice], ctx: Optional[dict] = None) -> List[CommentaryItem]:
         """Generate commentary based on current prices."""
         commentary = []
-        current_time = datetime.now()
+        ctx = ctx or self._tick_context()
+        current_time = ctx['now']
         
         # Check cooldown
-        if (current_time.timestamp() - self.last_commentary['price_update']) < self.cooldowns['price_update']:
+        if (ctx['now_ts'] - self.last_commentary['price_update']) < self.cooldowns['price_update']:
             return commentary
         
-        for symbol, price in prices.items():
-            # Only comment on significant movements
-            if price.change_pct_24h and abs(price.change_pct_24h) > 0.5:  # 0.5% threshold
-                change_direction = "up" if price.change_24h > 0 else "down"
-                
-                # Select random template
-                template = random.choice(self.templates['price_movement'])
-                
-                text = template.format(
-                    metal=price.name,
-                    price=price.price,
-                    change_direction=change_direction,
-                    abs_change=abs(price.change_24h),
-                    change_pct=price.change_pct_24h
-                )
-                
-                item = CommentaryItem(
-                    text=text,
-                    priority=1 if abs(price.change_pct_24h) > 2 else 2,
-                    category='market',
-                    timestamp=current_time
-                )
-                
-                commentary.append(item)
+        # Evaluate the movement thresholds for every metal at once
+        metals = list(prices.values())
+        pct = np.array([p.change_pct_24h or 0.0 for p in metals])
+        chg = np.array([p.change_24h or 0.0 for p in metals])
+        abs_pct = np.abs(pct)
+        sig_mask = abs_pct > 0.5  # 0.5% threshold
+        if not sig_mask.any():
+            return commentary
+        hi_mask = abs_pct > 2
+        
+        # Only comment on significant movements
+        for i in np.flatnonzero(sig_mask):
+            price = metals[i]
+            
+            # Select random template
+            template = self._rng.choice(self.templates['price_movement'])
+            
+            text = template(
+                metal=price.name,
+                price=price.price,
+                change_direction="up" if chg[i] > 0 else "down",
+                abs_change=abs(chg[i]),
+                change_pct=pct[i]
+            )
+            
+            item = CommentaryItem(
+                text=text,
+                priority=1 if hi_mask[i] else 2,
+                category='market',
+                timestamp=current_time
+            )
+            
+            if self._is_repeat(item):
+                continue
+            
+            commentary.append(item)
         
         if commentary:
-            self.last_commentary['price_update'] = current_time.timestamp()
+            self.last_commentary['price_update'] = ctx['now_ts']
         
         return commentary
     
-    def generate_news_commentary(self, articles: List[NewsArticle]) -> List[CommentaryItem]:
+    def generate_news_commentary(self, articles: List[NewsArticle], ctx: Optional[dict] = None) -> List[CommentaryItem]:
         """Generate commentary based on news articles."""
         commentary = []
-        current_time = datetime.now()
+        ctx = ctx or self._tick_context()
+        current_time = ctx['now']
         
         # Check cooldown
-        if (current_time.timestamp() - self.last_commentary['news_update']) < self.cooldowns['news_update']:
+        if (ctx['now_ts'] - self.last_commentary['news_update']) < self.cooldowns['news_update']:
             return commentary
         
         # Take top 3 most recent articles
         for article in articles[:3]:
-            template = random.choice(self.templates['news_headline'])
+            template = self._rng.choice(self.templates['news_headline'])
             
-            text = template.format(
+            text = template(
                 headline=article.title,
                 source=article.source
             )
@@ -269,33 +498,33 @@ class TTSEngine:
                 timestamp=current_time
             )
             
+            if self._is_repeat(item):
+                continue
+            
             commentary.append(item)
         
         if commentary:
-            self.last_commentary['news_update'] = current_time.timestamp()
+            self.last_commentary['news_update'] = ctx['now_ts']
         
         return commentary
     
-    def generate_market_status_commentary(self) -> List[CommentaryItem]:
+    def generate_market_status_commentary(self, ctx: Optional[dict] = None) -> List[CommentaryItem]:
         """Generate commentary based on market status."""
         commentary = []
-        current_time = datetime.now()
+        ctx = ctx or self._tick_context()
+        current_time = ctx['now']
         
         # Check cooldown
-        if (current_time.timestamp() - self.last_commentary['market_status']) < self.cooldowns['market_status']:
+        if (ctx['now_ts'] - self.last_commentary['market_status']) < self.cooldowns['market_status']:
             return commentary
         
-        # Check which markets are open
-        from ..graphics.graph_generator import GraphGenerator
-        graph_gen = GraphGenerator()
-        
-        open_markets = [m.name for m in graph_gen.market_hours if graph_gen.is_market_open(m)]
-        closed_markets = [m.name for m in graph_gen.market_hours if not graph_gen.is_market_open(m)]
+        open_markets = ctx['open_markets']
+        closed_markets = ctx['closed_markets']
         
         status = "active" if open_markets else "quiet"
         
-        template = random.choice(self.templates['market_status'])
-        text = template.format(
+        template = self._rng.choice(self.templates['market_status'])
+        text = template(
             status=status,
             open_markets=", ".join(open_markets) if open_markets else "no major markets",
             closed_markets=", ".join(closed_markets) if closed_markets else "all markets"
@@ -308,15 +537,43 @@ class TTSEngine:
             timestamp=current_time
         )
         
-        commentary.append(item)
-        self.last_commentary['market_status'] = current_time.timestamp()
+        if not self._is_repeat(item):
+            commentary.append(item)
+        self.last_commentary['market_status'] = ctx['now_ts']
         
         return commentary
     
-    def generate_analysis_commentary(self, prices: Dict[str, MetalPrice]) -> List[CommentaryItem]:
+    def _tick_context(self) -> dict:
+        """Build the per-cycle context shared by the commentary generators."""
+        now = datetime.now()
+        now_ts = now.timestamp()
+        statuses = self._market_statuses(now_ts)
+        return {
+            'now': now,
+            'now_ts': now_ts,
+            'open_markets': [name for name, is_open in statuses.items() if is_open],
+            'closed_markets': [name for name, is_open in statuses.items() if not is_open]
+        }
+    
+    def _market_statuses(self, now_ts: Optional[float] = None) -> Dict[str, bool]:
+        """Return open/closed status per market, recomputed at most once a minute."""
+        minute = int((now_ts if now_ts is not None else time.time()) // 60)
+        if minute != self._market_status_minute:
+            self._market_status = {
+                m.name: self._graph_gen.is_market_open(m) for m in self._graph_gen.market_hours
+            }
+            self._market_status_minute = minute
+        return self._market_status
+    
+    def generate_analysis_commentary(self, prices: Dict[str, MetalPrice], ctx: Optional[dict] = None) -> List[CommentaryItem]:
         """Generate technical analysis commentary."""
         commentary = []
-        current_time = datetime.now()
+        ctx = ctx or self._tick_context()
+        current_time = ctx['now']
+        
+        # Check cooldown
+        if (ctx['now_ts'] - self.last_commentary['analysis']) < self.cooldowns['analysis']:
+            return commentary
         
         # Simple analysis based on price movements
         for symbol, price in prices.items():
@@ -341,8 +598,8 @@ class TTSEngine:
                 sentiment = "neutral"
                 pattern = "consolidation"
             
-            template = random.choice(self.templates['analysis'])
-            text = template.format(
+            template = self._rng.choice(self.templates['analysis'])
+            text = template(
                 metal=price.name,
                 trend=trend,
                 sentiment=sentiment,
@@ -356,36 +613,55 @@ class TTSEngine:
                 timestamp=current_time
             )
             
+            if self._is_repeat(item):
+                continue
+            
             commentary.append(item)
         
+        if commentary:
+            self.last_commentary['analysis'] = ctx['now_ts']
+        
         return commentary
     
-    def update_commentary_queue(self) -> List[CommentaryItem]:
-        """Update the commentary queue with new items."""
-        # Get current data
-        prices = self.market_data_fetcher.fetch_prices()
-        articles = self.news_fetcher.fetch_news(max_articles=5)
+    def update_commentary_queue(self, prices: Optional[Dict[str, MetalPrice]] = None,
+                                articles: Optional[List[NewsArticle]] = None) -> List[CommentaryItem]:
+        """Update the commentary queue with new items.
+        
+        Args:
+            prices: Current prices, fetched here when needed if not supplied
+            articles: Current news, fetched here when needed if not supplied
+        """
+        ctx = self._tick_context()
+        
+        # Only fetch data a generator can use; the rest are still cooling down
+        def ready(name: str) -> bool:
+            return ctx['now_ts'] - self.last_commentary[name] >= self.cooldowns[name]
+        
+        if prices is None and (ready('price_update') or ready('analysis')):
+            prices = self.market_data_fetcher.fetch_prices()
+        if articles is None:
+            articles = self.news_fetcher.fetch_news(max_articles=5) if ready('news_update') else []
+        articles = articles[:5]
         
         # Generate commentary
         new_commentary = []
         
         if prices:
-            new_commentary.extend(self.generate_price_commentary(prices))
-            new_commentary.extend(self.generate_analysis_commentary(prices))
+            new_commentary.extend(self.generate_price_commentary(prices, ctx))
+            new_commentary.extend(self.generate_analysis_commentary(prices, ctx))
         
-        new_commentary.extend(self.generate_news_commentary(articles))
-        new_commentary.extend(self.generate_market_status_commentary())
+        new_commentary.extend(self.generate_news_commentary(articles, ctx))
+        new_commentary.extend(self.generate_market_status_commentary(ctx))
         
-        # Add to queue
-        for item in new_commentary:
-            self.commentary_queue.append(item)
+        self._append_log(new_commentary)
         
-        # Sort by priority and timestamp
-        self.commentary_queue.sort(key=lambda x: (x.priority, x.timestamp))
+        # Add to queue; the sequence number breaks ties so items are never compared
+        for item in new_commentary:
+            heapq.heappush(self.commentary_queue, (item.priority, item.timestamp, next(self._queue_seq), item))
         
-        # Limit queue size
+        # Limit queue size, keeping the most urgent items (a sorted list is a valid heap)
         if len(self.commentary_queue) > self.max_queue_size:
-            self.commentary_queue = self.commentary_queue[-self.max_queue_size:]
+            self.commentary_queue = heapq.nsmallest(self.max_queue_size, self.commentary_queue)
         
         return new_commentary
     
@@ -394,33 +670,124 @@ class TTSEngine:
         generated_files = []
         
         # Take top items by priority
-        items_to_process = self.commentary_queue[:max_items]
-        
-        for item in items_to_process:
-            if not item.audio_file or not os.path.exists(item.audio_file):
-                # Generate audio
-                engine = 'gtts' if 'gtts' in self.engines else 'pyttsx3'
-                audio_file = self.generate_audio(item.text, engine=engine)
-                
-                if audio_file:
-                    item.audio_file = audio_file
-                    generated_files.append(audio_file)
-                    logger.info(f"Generated audio: {item.text[:50]}...")
+        items_to_process = [item for item in self.peek_commentary(max_items) if not item.synthesized]
+        if not items_to_process:
+            return generated_files
+        
+        engines = [self._engine_for(item) for item in items_to_process]
+        gtts_jobs = [i for i, engine in enumerate(engines) if engine == 'gtts']
+        results: List[Optional[str]] = [None] * len(items_to_process)
+        
+        # gTTS calls are network-bound, so run them side by side while
+        # the pyttsx3 items render here as a single batch
+        with ThreadPoolExecutor(max_workers=max(1, min(len(gtts_jobs), _GTTS_WORKERS))) as ex:
+            futures = {
+                i: ex.submit(self.generate_audio, items_to_process[i].text, 'gtts')
+                for i in gtts_jobs
+            }
+            
+            pending = []
+            for i, engine in enumerate(engines):
+                if engine != 'pyttsx3':
+                    continue
+                key, output_path, cached = self._lookup_audio(items_to_process[i].text, engine)
+                if cached:
+                    results[i] = cached
                 else:
-                    logger.warning(f"Failed to generate audio for: {item.text[:50]}...")
+                    pending.append((i, key, output_path))
+            
+            batch = self.generate_audio_batch_pyttsx3(
+                [(items_to_process[i].text, output_path) for i, _, output_path in pending]
+            )
+            for (i, key, _), audio_file in zip(pending, batch):
+                if audio_file:
+                    self._audio_cache[key] = audio_file
+                results[i] = audio_file
+            
+            for i, future in futures.items():
+                results[i] = future.result()
+        
+        # Results are indexed by queue position, which is the playback order
+        for item, audio_file in zip(items_to_process, results):
+            if audio_file:
+                item.audio_file = audio_file
+                item.synthesized = True
+                generated_files.append(audio_file)
+                logger.info(f"Generated audio: {item.text[:50]}...")
+            else:
+                logger.warning(f"Failed to generate audio for: {item.text[:50]}...")
         
         return generated_files
     
+    def verify_audio_files(self) -> int:
+        """Re-check that synthesized audio still exists on disk.
+        
+        Returns:
+            Number of items reset for regeneration
+        """
+        missing = 0
+        for *_, item in self.commentary_queue:
+            if item.synthesized and not os.path.exists(item.audio_file):
+                item.synthesized = False
+                item.audio_file = None
+                missing += 1
+        
+        # Drop cache entries pointing at deleted files as well
+        for key, path in list(self._audio_cache.items()):
+            if not os.path.exists(path):
+                del self._audio_cache[key]
+        
+        self._last_audio_check = time.time()
+        if missing:
+            logger.warning(f"{missing} queued audio files went missing; they will be regenerated")
+        return missing
+    
+    def _engine_for(self, item: CommentaryItem) -> str:
+        """Pick the TTS engine for an item from its category and length."""
+        engine = self.engine_policy.get(item.category, 'gtts')
+        if engine == 'pyttsx3' and len(item.text) >= self.short_text_chars:
+            engine = 'gtts'
+        if engine not in self.engines:
+            engine = 'gtts' if 'gtts' in self.engines else 'pyttsx3'
+        return engine
+    
+    def peek_commentary(self, count: int) -> List[CommentaryItem]:
+        """Return the next ``count`` items in playback order without removing them."""
+        return [entry[-1] for entry in heapq.nsmallest(count, self.commentary_queue)]
+    
     def get_next_commentary(self) -> Optional[CommentaryItem]:
         """Get the next commentary item from the queue."""
         if not self.commentary_queue:
             return None
         
-        # Remove and return the first item
-        return self.commentary_queue.pop(0)
+        # Remove and return the most urgent item
+        return heapq.heappop(self.commentary_queue)[-1]
     
-    def save_commentary_log(self, filename: str = None):
-        """Save commentary log to file."""
+    def _append_log(self, items: List[CommentaryItem]):
+        """Append new commentary items to today's JSON Lines log."""
+        if not items or self._closed:
+            return
+        
+        try:
+            day = datetime.now().strftime("%Y%m%d")
+            if day != self._log_day:
+                if self._log_fh:
+                    self._log_fh.close()
+                log_file = os.path.join(self.output_dir, f"commentary_log_{day}.jsonl")
+                self._log_fh = open(log_file, 'ab', buffering=0)
+                self._log_day = day
+            
+            self._log_fh.write(b"".join(dumps(item.to_dict(), indent=False) + b"\n" for item in items))
+        except Exception as e:
+            logger.error(f"Error appending commentary log: {e}")
+    
+    def save_commentary_log(self, filename: str = None, pretty: bool = False):
+        """Save a full snapshot of the queue to file.
+        
+        Args:
+            filename: Output filename (dated default if None)
+            pretty: Indent the JSON for reading by hand
+        """
         if not filename:
             timestamp = datetime.now().strftime("%Y%m%d")
             filename = f"commentary_log_{timestamp}.json"
@@ -429,39 +796,62 @@ class TTSEngine:
         
         try:
             log_data = {
-                'timestamp': datetime.now().isoformat(),
-                'queue': [item.to_dict() for item in self.commentary_queue],
+                'timestamp': datetime.now(),
+                'queue': [item.to_dict() for item in self.peek_commentary(len(self.commentary_queue))],
                 'last_commentary': self.last_commentary
             }
             
-            with open(log_file, 'w') as f:
-                json.dump(log_data, f, indent=2)
+            with open(log_file, 'wb') as f:
+                f.write(dumps(log_data, indent=pretty))
             
             logger.info(f"Saved commentary log: {log_file}")
         except Exception as e:
             logger.error(f"Error saving commentary log: {e}")
     
-    def update_all(self) -> Dict[str, any]:
-        """Update all TTS components and return status."""
+    def update_all(self, prices: Optional[Dict[str, MetalPrice]] = None,
+                   articles: Optional[List[NewsArticle]] = None) -> Dict[str, any]:
+        """Update all TTS components and return status.
+        
+        Args:
+            prices: Current prices, fetched here when needed if not supplied
+            articles: Current news, fetched here when needed if not supplied
+        """
         # Update commentary queue
-        new_items = self.update_commentary_queue()
+        new_items = self.update_commentary_queue(prices, articles)
+        
+        # Periodically make sure generated audio has not been removed from disk
+        if time.time() - self._last_audio_check >= self.audio_check_interval:
+            self.verify_audio_files()
         
         # Generate audio for queue
         audio_files = self.generate_audio_for_queue()
         
-        # Save log
-        self.save_commentary_log()
-        
         return {
             'new_commentary_items': len(new_items),
             'queue_size': len(self.commentary_queue),
             'audio_files_generated': len(audio_files),
             'audio_files': audio_files
         }
+    
+    def close(self, pretty: bool = False):
+        """Write a final queue snapshot and close the commentary log. Safe to call more than once."""
+        if self._closed:
+            return
+        self._closed = True
+        
+        self.save_commentary_log(pretty=pretty)
+        self._pyttsx3_worker.shutdown(wait=True)
+        if self._log_fh:
+            self._log_fh.close()
+            self._log_fh = None
+            self._log_day = None
 
-# Global instance
-tts_engine = TTSEngine()
+# Global instance, created on first use
+_tts_engine: Optional[TTSEngine] = None
 
 def get_tts_engine() -> TTSEngine:
     """Get the global TTS engine instance."""
-    return tts_engine
+    global _tts_engine
+    if _tts_engine is None:
+        _tts_engine = TTSEngine()
+    return _tts_engine
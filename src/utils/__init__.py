@@ -0,0 +1,4 @@
+"""Shared utilities for Silver Ronin."""
+from .jsonio import dumps, loads
+
+__all__ = ['dumps', 'loads']
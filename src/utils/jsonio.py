@@ -0,0 +1,40 @@
+"""
+JSON serialization helpers.
+Uses orjson when installed, with a stdlib json fallback producing the same output.
+"""
+import json
+from dataclasses import fields, is_dataclass
+from datetime import datetime
+from loguru import logger
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    logger.warning("orjson not available. Install with: pip install orjson")
+
+
+def _json_default(obj):
+    """Serialize dataclasses and datetimes the way orjson does."""
+    if is_dataclass(obj):
+        return {f.name: getattr(obj, f.name) for f in fields(obj) if not f.name.startswith('_')}
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj, indent: bool = True) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes.
+    
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with two-space indentation
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False,
+                      default=_json_default).encode('utf-8')
+
+
+loads = orjson.loads if ORJSON_AVAILABLE else json.loads
@@ -4,7 +4,7 @@ import os
 import sys
 from datetime import datetime
 from dotenv import load_dotenv
-from src.data_fetchers.news_fetcher import get_news_fetcher
+from src.data_fetchers.news_fetcher import get_news_fetcher, format_dates
 
 def main():
     # Load environment variables
@@ -22,10 +22,10 @@ def main():
             return
         
         print(f"\nFound {len(articles)} articles:\n")
-        for i, article in enumerate(articles, 1):
+        for i, (article, published) in enumerate(zip(articles, format_dates(articles)), 1):
             print(f"{i}. {article.title}")
             print(f"   Source: {article.source}")
-            print(f"   Published: {article.formatted_date}")
+            print(f"   Published: {published}")
             print(f"   URL: {article.url}")
             if article.summary:
                 print(f"   Summary: {article.summary}")
@@ -44,7 +44,7 @@ def main():
         # Show queue items
         if engine.commentary_queue:
             print("\n3. Commentary queue preview:")
-            for i, item in enumerate(engine.commentary_queue[:5], 1):
+            for i, item in enumerate(engine.peek_commentary(5), 1):
                 print(f"  {i}. [{item.category.upper()}] {item.text[:60]}...")
                 print(f"     Priority: {item.priority}, Time: {item.timestamp.strftime('%H:%M:%S')}")
         